@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import json
 import logging
+import mmap
 import os
 import re
 import shutil
@@ -18,6 +19,20 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None
+
+try:
+    import orjson
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    # catch one exception type on either path.
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.JSONDecoder().decode
+
 # File-based error logging
 _log_file = Path.home() / ".claude" / "hooks.log"
 _log_file.parent.mkdir(parents=True, exist_ok=True)
@@ -30,22 +45,95 @@ logging.basicConfig(
 
 MAX_TAIL_LINES = 300  # Reduced from 600 - we extract structured state instead
 CHECKPOINT_RETENTION_DAYS = 7  # Auto-delete checkpoints older than this
+_CHECKPOINT_SUFFIXES = (".jsonl", ".md")
+OFFSETS_FILE = ".offsets.json"  # Per-session read position, so repeat runs only parse new bytes
+
+_FICLONE = 0x40049409  # Linux ioctl: reflink dst to src's extents (Btrfs, XFS, bcachefs)
+
+# Bounds for the list fields of the extracted state, newest kept. They also
+# cap the state merged across incremental runs, which would otherwise grow
+# for the life of the session (0 = unbounded).
+_LIST_LIMITS = {
+    "pending_tasks": 5,
+    "key_decisions": 5,
+    "files_modified": 20,
+    "artifacts_created": 20,
+}
+
+# Compiled once at import; the extraction loop runs them on every tail line.
+_ISSUE_RE = re.compile(r"[Ii]ssue[#\s]*(\d+)")
+_ARTIFACT_RE = re.compile(r"AGENT_RETURN:\s*(\S+\.md)")
+_FILE_RE = re.compile(r"(?:created|modified|updated).*?([a-zA-Z0-9_/]+\.(?:py|jsx?|tsx?|md))", re.IGNORECASE)
+_TODO_RE = re.compile(r"- \[ \] (.+?)(?:\n|$)")
+_SENT_SPLIT_RE = re.compile(r"[.!?]")
+_DECISION_RE = re.compile(r"decided|decision:|chose|approach:", re.IGNORECASE)
+_DECISION_SENT_RE = re.compile(r"decided|decision|chose|approach", re.IGNORECASE)
+# Union of every token the extractors below look for. Most transcript lines are
+# routine tool output that matches none of them, so one scan skips the rest.
+_HOT_RE = re.compile(
+    r"issue|MAP-PLAN|TEST-PLAN|CONTRACT|PATCH|PROVE|AGENT_RETURN"
+    r"|created|modified|updated|- \[ \]|decided|decision|chose|approach",
+    re.IGNORECASE,
+)
+
+
+def read_tail(path: Path, max_lines: int, offset: int = 0) -> tuple[list[str], int]:
+    """Get the last N lines written at or after ``offset``, plus the end offset.
+
+    Scans backwards through an mmap with ``rfind`` so each step only touches
+    the bytes between two newlines -- no growing buffer, no recounting. The
+    end offset is just past the last complete line: a trailing line still
+    being written is returned but not consumed, so the next call from that
+    offset reads it again once it is finished.
+    """
+    with path.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if max_lines <= 0 or size <= offset:
+            return [], size
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = size - 1 if mm[size - 1] == 0x0A else size
+            start = end
+            for _ in range(max_lines):
+                nl = mm.rfind(b"\n", offset, start)
+                if nl < 0:
+                    start = offset
+                    break
+                start = nl
+            else:
+                start += 1
+            lines = mm[start:end].splitlines()[-max_lines:]
+            last_nl = mm.rfind(b"\n", offset, size)
+            consumed = last_nl + 1 if last_nl >= 0 else offset
+    return [ln.decode("utf-8", errors="replace") for ln in lines], consumed
+
+
+def copy_transcript(src: Path, dst: Path) -> None:
+    """Checkpoint the transcript, reflinking where the filesystem allows.
+
+    A reflink is a copy-on-write clone: O(1) regardless of transcript size,
+    and unaffected by later appends to ``src``. A hardlink would be just as
+    cheap but shares the inode, so the checkpoint would keep growing with the
+    live transcript. Anything that cannot clone falls back to
+    ``shutil.copyfile`` (sendfile on Linux, fcopyfile on macOS).
+    """
+    if fcntl is not None:
+        try:
+            with src.open("rb") as fsrc, dst.open("wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
 
 
 def tail_lines(path: Path, max_lines: int) -> list[str]:
     """Get last N lines from file."""
-    with path.open("rb") as f:
-        f.seek(0, os.SEEK_END)
-        size = f.tell()
-        block = 8192
-        data = b""
-        while size > 0 and data.count(b"\n") <= max_lines:
-            step = min(block, size)
-            size -= step
-            f.seek(size)
-            data = f.read(step) + data
-        lines = data.splitlines()[-max_lines:]
-        return [ln.decode("utf-8", errors="replace") for ln in lines]
+    return read_tail(path, max_lines)[0]
+
+
+def _newest(items: list, limit: int) -> list:
+    """The last ``limit`` items (all of them when limit is 0)."""
+    return items[-limit:] if limit else items
 
 
 def extract_state_from_transcript(transcript_lines: list[str]) -> dict:
@@ -54,19 +142,31 @@ def extract_state_from_transcript(transcript_lines: list[str]) -> dict:
         "last_issue": None,
         "last_phase": None,
         "last_action": None,
-        "pending_tasks": [],
-        "key_decisions": [],
-        "files_modified": [],
-        "artifacts_created": [],
     }
+    # Files and artifacts dedup through insertion-ordered dicts (O(1)
+    # membership) and are cut to their bound once, at the end. Tasks and
+    # decisions are short lists trimmed after each line, so an item is only a
+    # duplicate of what is still kept at that line boundary.
+    task_limit = _LIST_LIMITS["pending_tasks"]
+    decision_limit = _LIST_LIMITS["key_decisions"]
+    pending_tasks: list[str] = []
+    key_decisions: list[str] = []
+    files_modified: dict[str, None] = {}
+    artifacts_created: dict[str, None] = {}
 
     for line in transcript_lines:
+        # Transcript entries are JSON objects; skip blanks and anything else
+        # before paying for a parse.
+        if not line or line[0] != "{":
+            continue
         try:
-            msg = json.loads(line)
+            msg = _json_loads(line)
             content = str(msg.get("content", ""))
+            if not _HOT_RE.search(content):
+                continue
 
             # Extract issue numbers (most recent wins)
-            if matches := re.findall(r"[Ii]ssue[#\s]*(\d+)", content):
+            if matches := _ISSUE_RE.findall(content):
                 state["last_issue"] = int(matches[-1])
 
             # Extract phase (most recent wins)
@@ -75,42 +175,113 @@ def extract_state_from_transcript(transcript_lines: list[str]) -> dict:
                     state["last_phase"] = phase
 
             # Extract artifacts created
-            if match := re.search(r"AGENT_RETURN:\s*(\S+\.md)", content):
-                artifact = match.group(1)
-                if artifact not in state["artifacts_created"]:
-                    state["artifacts_created"].append(artifact)
+            if match := _ARTIFACT_RE.search(content):
+                artifacts_created.setdefault(match.group(1))
 
             # Extract file modifications
-            if match := re.search(r"(?:created|modified|updated).*?([a-zA-Z0-9_/]+\.(?:py|jsx?|tsx?|md))", content, re.I):
-                filepath = match.group(1)
-                if filepath not in state["files_modified"]:
-                    state["files_modified"].append(filepath)
+            if match := _FILE_RE.search(content):
+                files_modified.setdefault(match.group(1))
 
             # Extract TODO items (last 5)
             if "- [ ]" in content:
-                todos = re.findall(r"- \[ \] (.+?)(?:\n|$)", content)
-                for todo in todos[-5:]:
-                    if todo not in state["pending_tasks"]:
-                        state["pending_tasks"].append(todo)
-                state["pending_tasks"] = state["pending_tasks"][-5:]
+                todos = _TODO_RE.findall(content)
+                for todo in todos[-task_limit:]:
+                    if todo not in pending_tasks:
+                        pending_tasks.append(todo)
+                del pending_tasks[:-task_limit]
 
             # Extract key decisions (look for decision keywords)
-            if any(kw in content.lower() for kw in ["decided", "decision:", "chose", "approach:"]):
+            if _DECISION_RE.search(content):
                 # Extract sentence containing decision
-                sentences = re.split(r'[.!?]', content)
+                sentences = _SENT_SPLIT_RE.split(content)
                 for sent in sentences:
-                    if any(kw in sent.lower() for kw in ["decided", "decision", "chose", "approach"]):
+                    if _DECISION_SENT_RE.search(sent):
                         clean = sent.strip()[:100]
-                        if clean and clean not in state["key_decisions"]:
-                            state["key_decisions"].append(clean)
-                state["key_decisions"] = state["key_decisions"][-5:]
+                        if clean and clean not in key_decisions:
+                            key_decisions.append(clean)
+                del key_decisions[:-decision_limit]
 
         except (json.JSONDecodeError, TypeError):
             continue
 
+    state["pending_tasks"] = pending_tasks
+    state["key_decisions"] = key_decisions
+    state["files_modified"] = _newest(list(files_modified), _LIST_LIMITS["files_modified"])
+    state["artifacts_created"] = _newest(list(artifacts_created), _LIST_LIMITS["artifacts_created"])
     return state
 
 
+def merge_extracted_state(prior: dict, new: dict) -> dict:
+    """Fold state extracted from new transcript bytes into a cached state.
+
+    Scalars from ``new`` win when set; lists are extended, deduped, and held
+    to the same bounds ``extract_state_from_transcript`` applies.
+    """
+    merged = dict(prior)
+    for key in ("last_issue", "last_phase", "last_action"):
+        if new.get(key) is not None:
+            merged[key] = new[key]
+    for key, limit in _LIST_LIMITS.items():
+        combined = list(dict.fromkeys([*prior.get(key, []), *new.get(key, [])]))
+        merged[key] = _newest(combined, limit)
+    return merged
+
+
+def load_offsets(out_dir: Path) -> dict:
+    """Load the per-session transcript offset sidecar (empty on any error)."""
+    try:
+        data = json.loads((out_dir / OFFSETS_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_offsets(out_dir: Path, offsets: dict, retention_days: int) -> None:
+    """Persist the offset sidecar, dropping sessions idle past retention."""
+    cutoff = datetime.now().timestamp() - (retention_days * 86400)
+    live = {sid: rec for sid, rec in offsets.items() if rec.get("mtime", 0) >= cutoff}
+    path = out_dir / OFFSETS_FILE
+    tmp = path.with_suffix(".json.tmp")
+    try:
+        tmp.write_text(json.dumps(live), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def extract_incremental(transcript_path: Path, session_id: str, offsets: dict) -> dict:
+    """Extract state, reading only bytes appended since the last run.
+
+    ``offsets`` maps session_id -> {size, mtime, offset, state} and is updated
+    in place. A transcript that shrank (rewritten or rotated) is re-read from
+    its tail as if seen for the first time.
+    """
+    st = transcript_path.stat()
+    record = offsets.get(session_id)
+    if record and record.get("size") == st.st_size and record.get("mtime") == st.st_mtime:
+        return record["state"]
+
+    prior = None
+    offset = 0
+    if record and 0 < record.get("offset", 0) <= st.st_size and isinstance(record.get("state"), dict):
+        prior = record["state"]
+        offset = record["offset"]
+
+    lines, end = read_tail(transcript_path, MAX_TAIL_LINES, offset)
+    extracted = extract_state_from_transcript(lines)
+    if prior is not None:
+        extracted = merge_extracted_state(prior, extracted)
+
+    offsets[session_id] = {
+        "size": st.st_size,
+        "mtime": st.st_mtime,
+        "offset": end,
+        "state": extracted,
+    }
+    return extracted
+
+
 def update_persistent_state(project_dir: Path, extracted: dict) -> None:
     """Update PERSISTENT_STATE.yaml with extracted info via state_manager."""
     try:
@@ -131,25 +302,57 @@ def cleanup_old_checkpoints(out_dir: Path, retention_days: int) -> int:
     cutoff = datetime.now().timestamp() - (retention_days * 86400)
     deleted = 0
 
-    for f in out_dir.iterdir():
-        # Skip PERSISTENT_STATE.yaml and other non-checkpoint files
-        if f.name == "PERSISTENT_STATE.yaml":
-            continue
-        if not (f.suffix in [".jsonl", ".md"] and "__" in f.name):
-            continue
+    with os.scandir(out_dir) as entries:
+        for entry in entries:
+            # Skip PERSISTENT_STATE.yaml and other non-checkpoint files
+            name = entry.name
+            if not (name.endswith(_CHECKPOINT_SUFFIXES) and "__" in name):
+                continue
 
-        try:
-            if f.stat().st_mtime < cutoff:
-                f.unlink()
-                deleted += 1
-        except OSError:
-            continue
+            try:
+                if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    deleted += 1
+            except OSError:
+                continue
 
     return deleted
 
 
+def render_summary(ts: str, session_id: str, trigger: str, transcript_name: str, extracted: dict) -> str:
+    """Render the checkpoint markdown as one list of lines, joined once."""
+    parts = [
+        "# Claude Code Checkpoint",
+        "",
+        f"- **Time**: {ts}",
+        f"- **Session**: {session_id}",
+        f"- **Trigger**: {trigger}",
+        f"- **Transcript**: {transcript_name}",
+        "",
+        "## Extracted State",
+        "",
+        f"- **Last Issue**: #{extracted['last_issue'] or 'None'}",
+        f"- **Last Phase**: {extracted['last_phase'] or 'None'}",
+        f"- **Artifacts Created**: {', '.join(extracted['artifacts_created']) or 'None'}",
+    ]
+    sections = (
+        ("Pending Tasks", "- [ ] ", extracted["pending_tasks"]),
+        ("Files Modified", "- ", extracted["files_modified"][-10:]),
+        ("Key Decisions", "- ", extracted["key_decisions"]),
+    )
+    for title, prefix, items in sections:
+        parts.append("")
+        parts.append(f"## {title}")
+        if items:
+            parts.extend(prefix + item for item in items)
+        else:
+            parts.append("- None")
+    parts.append("")
+    return "\n".join(parts)
+
+
 def main() -> int:
-    hook_in = json.load(sys.stdin)
+    hook_in = json.loads(sys.stdin.buffer.read())
     transcript_path = Path(hook_in["transcript_path"]).expanduser()
 
     project_dir = Path(os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd()))
@@ -162,36 +365,19 @@ def main() -> int:
 
     # 1) Copy the transcript as a raw checkpoint (for recovery)
     raw_dst = out_dir / f"{ts}__{session_id}__{trigger}.transcript.jsonl"
-    shutil.copyfile(transcript_path, raw_dst)
+    copy_transcript(transcript_path, raw_dst)
 
-    # 2) Extract structured state from transcript
-    tail = tail_lines(transcript_path, MAX_TAIL_LINES)
-    extracted = extract_state_from_transcript(tail)
+    # 2) Extract structured state from transcript (only bytes new since last run)
+    offsets = load_offsets(out_dir)
+    extracted = extract_incremental(transcript_path, session_id, offsets)
+    try:
+        save_offsets(out_dir, offsets, CHECKPOINT_RETENTION_DAYS)
+    except OSError as e:
+        print(f"[precompact] Warning: Could not save transcript offsets: {e}", file=sys.stderr)
 
     # 3) Create a compact summary (not full tail dump)
     md_dst = out_dir / f"{ts}__{session_id}__{trigger}.md"
-    summary = f"""# Claude Code Checkpoint
-
-- **Time**: {ts}
-- **Session**: {session_id}
-- **Trigger**: {trigger}
-- **Transcript**: {raw_dst.name}
-
-## Extracted State
-
-- **Last Issue**: #{extracted['last_issue'] or 'None'}
-- **Last Phase**: {extracted['last_phase'] or 'None'}
-- **Artifacts Created**: {', '.join(extracted['artifacts_created']) or 'None'}
-
-## Pending Tasks
-{chr(10).join(f'- [ ] {t}' for t in extracted['pending_tasks']) or '- None'}
-
-## Files Modified
-{chr(10).join(f'- {f}' for f in extracted['files_modified'][-10:]) or '- None'}
-
-## Key Decisions
-{chr(10).join(f'- {d}' for d in extracted['key_decisions']) or '- None'}
-"""
+    summary = render_summary(ts, session_id, trigger, raw_dst.name, extracted)
     md_dst.write_text(summary, encoding="utf-8")
 
     # 4) Update PERSISTENT_STATE.yaml with extracted info
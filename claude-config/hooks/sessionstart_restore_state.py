@@ -50,20 +50,10 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 
-try:
-    import yaml
-
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
-
-# Try to import centralized state manager
-try:
-    from state_manager import get_active_work as _sm_get_active_work
-
-    HAS_STATE_MANAGER = True
-except ImportError:
-    HAS_STATE_MANAGER = False
+# PyYAML is imported on first use (see _yaml_loader): the common
+# PERSISTENT_STATE.yaml shape is handled by a line scan, so most sessions
+# never pay the import.
+_YAML_LOADER = None
 
 
 # ---------------------------------------------------------------- safety-filter
@@ -312,12 +302,76 @@ def _redact_secret_name(name: str) -> str:
 # ---------------------------------------------------------------- active-work
 
 
+# A block-level ``key: value`` line under active_work whose value is a plain
+# scalar (no quoting, flow collections, anchors, tags, block scalars, comments).
+_ACTIVE_WORK_LINE_RE = re.compile(r"^  ([A-Za-z_][\w-]*):(?: +([^'\"{}\[\]&*!|>#%@`\s][^#]*?))?\s*$")
+
+
+def _yaml_loader():
+    """Return the fastest available SafeLoader class (None without PyYAML)."""
+    global _YAML_LOADER
+    if _YAML_LOADER is None:
+        try:
+            import yaml
+        except ImportError:
+            _YAML_LOADER = False
+        else:
+            _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return _YAML_LOADER or None
+
+
+# Plain scalars SafeLoader would resolve to something other than a str or int
+# (bools, nulls, floats, octals, dates); the fast path defers those to YAML.
+_NON_STR_SCALAR_RE = re.compile(
+    r"^(?:[-+.\d].*|~|null|true|false|yes|no|on|off|y|n|=)$", re.IGNORECASE
+)
+_INT_RE = re.compile(r"^(?:0|[1-9]\d*)$")
+
+
+def _fast_active_work(yaml_content: str) -> dict | None:
+    """Line-scan the active_work block of the flat state file state_manager writes.
+
+    Returns None as soon as anything looks nested or non-trivial, so the
+    caller can fall back to a real YAML parse.
+    """
+    lines = yaml_content.splitlines()
+    try:
+        start = lines.index("active_work:") + 1
+    except ValueError:
+        return None
+    work: dict = {}
+    for line in lines[start:]:
+        if not line.strip():
+            continue
+        if not line.startswith(" "):
+            break
+        m = _ACTIVE_WORK_LINE_RE.match(line)
+        if not m or m.group(2) is None:
+            return None
+        value = m.group(2)
+        if ": " in value or value.endswith(":"):
+            return None
+        if _INT_RE.match(value):
+            work[m.group(1)] = int(value)
+        elif _NON_STR_SCALAR_RE.match(value):
+            return None
+        else:
+            work[m.group(1)] = value
+    return work
+
+
 def get_active_work(yaml_content: str) -> dict:
-    """Extract active_work from YAML content (fallback when state_manager unavailable)."""
-    if not HAS_YAML:
+    """Extract active_work from PERSISTENT_STATE.yaml content."""
+    fast = _fast_active_work(yaml_content)
+    if fast is not None:
+        return fast
+    loader = _yaml_loader()
+    if loader is None:
         return {}
+    import yaml
+
     try:
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(yaml_content, Loader=loader)
         return data.get("active_work", {}) if data else {}
     except Exception as e:
         logging.warning(f"Failed to parse YAML state: {e}", exc_info=True)
@@ -730,7 +784,7 @@ def _maybe_pull_agents(
 
 
 def main() -> int:
-    _hook_in = json.load(sys.stdin)
+    _hook_in = json.loads(sys.stdin.buffer.read())
 
     # 0. Pull latest agents config at most once per day (stamp-guarded, fail-open).
     _agents_root = Path.home() / "agents"
@@ -745,7 +799,8 @@ def main() -> int:
     project_memory_dir = project_dir / ".claude" / "memory"
     global_memory_dir = global_claude_dir / "memory"
 
-    print("## Restored Context\n")
+    # Collected and written once at the end: one stdout write instead of ~20.
+    out: list[str] = ["## Restored Context\n"]
 
     # 1. Load compact YAML state (preferred) or fallback to markdown
     yaml_state = checkpoints_dir / "PERSISTENT_STATE.yaml"
@@ -754,18 +809,15 @@ def main() -> int:
     active_work = {}
     if yaml_state.exists():
         yaml_content = yaml_state.read_text(encoding="utf-8")
-        if HAS_STATE_MANAGER:
-            active_work = _sm_get_active_work(project_dir)
-        else:
-            active_work = get_active_work(yaml_content)
-        print("### Project State\n")
-        print("```yaml")
-        print(yaml_content)
-        print("```\n")
+        active_work = get_active_work(yaml_content)
+        out.append("### Project State\n")
+        out.append("```yaml")
+        out.append(yaml_content)
+        out.append("```\n")
     elif md_state.exists():
-        print("### Project State\n")
-        print(md_state.read_text(encoding="utf-8"))
-        print()
+        out.append("### Project State\n")
+        out.append(md_state.read_text(encoding="utf-8"))
+        out.append("")
 
     # 2. Load critical patterns (project-specific first, then global fallback)
     patterns_critical = project_memory_dir / "patterns-critical.md"
@@ -773,26 +825,26 @@ def main() -> int:
         patterns_critical = global_memory_dir / "patterns-critical.md"
 
     if patterns_critical.exists():
-        print("### Critical Patterns (Always Apply)\n")
-        print(patterns_critical.read_text(encoding="utf-8"))
-        print()
+        out.append("### Critical Patterns (Always Apply)\n")
+        out.append(patterns_critical.read_text(encoding="utf-8"))
+        out.append("")
     else:
         # Fallback: try reading rules/core-patterns.md (canonical source)
         core_patterns = global_claude_dir / "rules" / "core-patterns.md"
         if core_patterns.exists():
-            print("### Critical Patterns (Always Apply)\n")
-            print(core_patterns.read_text(encoding="utf-8"))
-            print()
+            out.append("### Critical Patterns (Always Apply)\n")
+            out.append(core_patterns.read_text(encoding="utf-8"))
+            out.append("")
         else:
             # Last resort: minimal inline reminder
-            print("### Critical Patterns\n")
-            print("1. **VERIFICATION_GAP**: Read spec/code before assuming")
-            print(
+            out.append("### Critical Patterns\n")
+            out.append("1. **VERIFICATION_GAP**: Read spec/code before assuming")
+            out.append(
                 "2. **ENUM_VALUE**: Use VALUES not Python names (CO-OWNER not CO_OWNER)"
             )
-            print("3. **COMPONENT_API**: Read PropTypes before using components")
-            print()
-            print("Full patterns: `~/.claude/rules/core-patterns.md`\n")
+            out.append("3. **COMPONENT_API**: Read PropTypes before using components")
+            out.append("")
+            out.append("Full patterns: `~/.claude/rules/core-patterns.md`\n")
 
     # 3. Check for active orchestrate workflow and provide continue instructions
     issue = active_work.get("issue")
@@ -800,20 +852,20 @@ def main() -> int:
     branch = active_work.get("branch")
 
     if issue and phase:
-        print("### ACTIVE ORCHESTRATE WORKFLOW\n")
-        print(f"**Issue**: #{issue}")
-        print(f"**Phase**: {phase}")
-        print(f"**Branch**: {branch}")
-        print()
-        print("**CRITICAL**: You were in the middle of an orchestrate workflow.")
-        print("Continue with the current phase using the Task tool:")
-        print()
-        print("1. Read `.claude/commands/orchestrate.md` for phase instructions")
-        print("2. Check for existing artifacts in `.agents/outputs/`")
-        print(f"3. Continue the `{phase}` phase for issue #{issue}")
-        print()
-        print("If the phase was completed, proceed to the next phase in the workflow.")
-        print()
+        out.append("### ACTIVE ORCHESTRATE WORKFLOW\n")
+        out.append(f"**Issue**: #{issue}")
+        out.append(f"**Phase**: {phase}")
+        out.append(f"**Branch**: {branch}")
+        out.append("")
+        out.append("**CRITICAL**: You were in the middle of an orchestrate workflow.")
+        out.append("Continue with the current phase using the Task tool:")
+        out.append("")
+        out.append("1. Read `.claude/commands/orchestrate.md` for phase instructions")
+        out.append("2. Check for existing artifacts in `.agents/outputs/`")
+        out.append(f"3. Continue the `{phase}` phase for issue #{issue}")
+        out.append("")
+        out.append("If the phase was completed, proceed to the next phase in the workflow.")
+        out.append("")
 
     # 3.5 Project-memory auto-recall (#365). The CTA-only approach measured
     #     0.9% adoption (13 recalls / 328 sessions) — facts were written and
@@ -825,7 +877,7 @@ def main() -> int:
     if fact_dir.is_dir():
         section = render_project_memory(fact_dir)
         if section:
-            print(section)
+            out.append(section)
 
     # 4. Hint about full patterns location — only if the file actually exists.
     #    patterns-full.md is produced by `/learn`; advertising it before that
@@ -833,11 +885,12 @@ def main() -> int:
     if (project_memory_dir / "patterns-full.md").exists() or (
         global_memory_dir / "patterns-full.md"
     ).exists():
-        print("---")
-        print(
+        out.append("---")
+        out.append(
             "*Full patterns available at `.claude/memory/patterns-full.md` if needed.*\n"
         )
 
+    sys.stdout.write("\n".join(out) + "\n")
     return 0
 
 
@@ -35,6 +35,10 @@ try:
     import yaml
 
     HAS_YAML = True
+    # libyaml-backed C loader/dumper are ~10x faster; fall back when PyYAML
+    # was built without it.
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    _YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 except ImportError:
     HAS_YAML = False
 
@@ -96,7 +100,7 @@ def load_state(project_dir: Path) -> dict:
     if not path.exists():
         return {}
     try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+        data = yaml.load(path.read_text(encoding="utf-8"), Loader=_YamlLoader)
         return data if isinstance(data, dict) else {}
     except Exception as e:
         logging.warning(f"Failed to load state: {e}")
@@ -104,13 +108,23 @@ def load_state(project_dir: Path) -> dict:
 
 
 def _write_state(project_dir: Path, data: dict) -> None:
-    """Write state dict back to PERSISTENT_STATE.yaml."""
+    """Write state dict back to PERSISTENT_STATE.yaml.
+
+    Serialized to a string first, then written in one call to a sibling tmp
+    file and swapped in with ``os.replace`` so readers never see a partial file.
+    """
     if not HAS_YAML:
         return
     path = _state_path(project_dir)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+    text = yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+    tmp = path.with_suffix(".yaml.tmp")
+    try:
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def update_phase(
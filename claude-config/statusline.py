@@ -1,14 +1,25 @@
 #!/usr/bin/env python3
 import json
+import os
 import socket
 import sys
-import getpass
+import time
 from datetime import datetime
 
 
+def _username() -> str:
+    """Login name from the environment; getpass (pwd lookup) only as a fallback."""
+    name = os.environ.get("USER") or os.environ.get("LOGNAME") or os.environ.get("USERNAME")
+    if name:
+        return name
+    import getpass
+
+    return getpass.getuser()
+
+
 def main():
-    # Read JSON input from stdin
-    input_data = json.load(sys.stdin)
+    # Parse the raw bytes: skips decoding stdin to text before the JSON parse
+    input_data = json.loads(sys.stdin.buffer.read())
 
     # ANSI color codes
     BLUE = "\033[34m"
@@ -24,11 +35,9 @@ def main():
     server = f"{BLUE}{hostname}{RESET}"
 
     # Get username (pink)
-    username = f"{PINK}{getpass.getuser()}{RESET}"
+    username = f"{PINK}{_username()}{RESET}"
 
     # Current working directory, home-relative (cyan)
-    import os
-
     home = os.path.expanduser("~")
     cwd_raw = os.getcwd()
     cwd_display = "~" + cwd_raw[len(home) :] if cwd_raw.startswith(home) else cwd_raw
@@ -56,7 +65,7 @@ def main():
     agent_display = f" | {ORANGE}{agent_name}{RESET}" if agent_name else ""
 
     # Get current date in MM/DD format (orange)
-    current_date = f"{ORANGE}{datetime.now().strftime('%m/%d')}{RESET}"
+    current_date = f"{ORANGE}{time.strftime('%m/%d')}{RESET}"
 
     # Get context used percentage (green)
     context_window = input_data.get("context_window", {})
@@ -0,0 +1,239 @@
+"""Tests for the PreCompact transcript extractor (precompact_checkpoint.py)."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "hooks"))
+
+import precompact_checkpoint as H  # noqa: E402
+
+
+def _line(content: str) -> str:
+    return json.dumps({"content": content})
+
+
+def test_extracts_issue_phase_and_artifacts():
+    lines = [
+        _line("Working on issue #41 now"),
+        _line("Entering MAP-PLAN"),
+        _line("Moving to issue 42, phase PATCH"),
+        _line("AGENT_RETURN: patch-42.md"),
+    ]
+    state = H.extract_state_from_transcript(lines)
+    assert state["last_issue"] == 42
+    assert state["last_phase"] == "PATCH"
+    assert state["artifacts_created"] == ["patch-42.md"]
+
+
+def test_routine_lines_are_skipped_by_prefilter():
+    lines = [_line("ran 12 tests in 0.4s"), _line("ok"), "not json at all"]
+    state = H.extract_state_from_transcript(lines)
+    assert state["last_issue"] is None
+    assert state["files_modified"] == []
+    assert state["key_decisions"] == []
+
+
+def test_files_todos_and_decisions_are_deduped():
+    lines = [
+        _line("Modified src/app.py to add retries"),
+        _line("updated src/app.py again"),
+        _line("- [ ] write docs\n- [ ] add test"),
+        _line("- [ ] write docs"),
+        _line("We DECIDED to keep sqlite. Then moved on."),
+        _line("We DECIDED to keep sqlite. Then moved on."),
+    ]
+    state = H.extract_state_from_transcript(lines)
+    assert state["files_modified"] == ["src/app.py"]
+    assert state["pending_tasks"] == ["write docs", "add test"]
+    assert state["key_decisions"] == ["We DECIDED to keep sqlite"]
+
+
+def test_bounded_lists_dedup_against_items_already_trimmed():
+    # "a" fell out of the kept five only after this line's appends, so it is
+    # still a duplicate when seen again in the same line
+    lines = [
+        _line("".join(f"- [ ] {t}\n" for t in "abcde")),
+        _line("".join(f"- [ ] {t}\n" for t in "fghia")),
+    ]
+    state = H.extract_state_from_transcript(lines)
+    assert state["pending_tasks"] == ["e", "f", "g", "h", "i"]
+
+    lines = [_line("".join(f"We decided {t}. " for t in group)) for group in ("abcde", "fghia")]
+    state = H.extract_state_from_transcript(lines)
+    assert state["key_decisions"] == [f"We decided {t}" for t in "efghi"]
+
+
+def test_tail_lines_returns_last_n(tmp_path):
+    path = tmp_path / "t.jsonl"
+    path.write_bytes(b"".join(f"line{i}\n".encode() for i in range(1000)))
+    assert H.tail_lines(path, 3) == ["line997", "line998", "line999"]
+    assert H.tail_lines(path, 1) == ["line999"]
+
+
+def test_tail_lines_short_and_empty_files(tmp_path):
+    path = tmp_path / "t.jsonl"
+    path.write_bytes(b"")
+    assert H.tail_lines(path, 5) == []
+    path.write_bytes(b"a\nb")
+    assert H.tail_lines(path, 5) == ["a", "b"]
+    assert H.tail_lines(path, 1) == ["b"]
+
+
+def test_read_tail_starts_at_offset(tmp_path):
+    path = tmp_path / "t.jsonl"
+    path.write_bytes(b"old1\nold2\nnew1\nnew2\n")
+    lines, end = H.read_tail(path, 10, offset=len(b"old1\nold2\n"))
+    assert lines == ["new1", "new2"]
+    assert end == path.stat().st_size
+
+
+def test_incremental_extraction_merges_with_cached_state(tmp_path):
+    path = tmp_path / "t.jsonl"
+    path.write_text(_line("issue #7 in MAP-PLAN") + "\n" + _line("created a/b.py") + "\n")
+    offsets: dict = {}
+    first = H.extract_incremental(path, "s1", offsets)
+    assert first["last_issue"] == 7
+    first_offset = offsets["s1"]["offset"]
+    assert first_offset == path.stat().st_size
+
+    with path.open("a") as f:
+        f.write(_line("now in PATCH, updated c/d.py") + "\n")
+    second = H.extract_incremental(path, "s1", offsets)
+    assert second["last_issue"] == 7
+    assert second["last_phase"] == "PATCH"
+    assert second["files_modified"] == ["a/b.py", "c/d.py"]
+    assert offsets["s1"]["offset"] > first_offset
+
+
+def test_merge_keeps_newest_items_within_limits():
+    prior = {key: [f"old{i}" for i in range(limit)] for key, limit in H._LIST_LIMITS.items()}
+    new = {key: ["old0", "new0", "new1"] for key in H._LIST_LIMITS}
+    merged = H.merge_extracted_state(prior, new)
+    for key, limit in H._LIST_LIMITS.items():
+        # "old0" keeps its original (oldest) slot, so it is among the dropped
+        expected = [f"old{i}" for i in range(limit)] + ["new0", "new1"]
+        assert merged[key] == expected[-limit:]
+
+
+def test_incremental_extraction_stays_bounded_across_runs(tmp_path):
+    path = tmp_path / "t.jsonl"
+    path.write_text("")
+    offsets: dict = {}
+    limit = H._LIST_LIMITS["files_modified"]
+    for run in range(limit * 2):
+        with path.open("a") as f:
+            f.write(_line(f"created f{run}.py, AGENT_RETURN: a{run}.md") + "\n")
+        state = H.extract_incremental(path, "s1", offsets)
+    assert state["files_modified"] == [f"f{i}.py" for i in range(limit, limit * 2)]
+    assert len(state["artifacts_created"]) == H._LIST_LIMITS["artifacts_created"]
+    assert state["artifacts_created"][-1] == f"a{limit * 2 - 1}.md"
+
+
+def test_single_extraction_bounds_files_and_artifacts():
+    lines = [_line(f"modified f{i}.py, AGENT_RETURN: a{i}.md") for i in range(50)]
+    state = H.extract_state_from_transcript(lines)
+    assert state["files_modified"] == [f"f{i}.py" for i in range(50 - H._LIST_LIMITS["files_modified"], 50)]
+    assert state["artifacts_created"] == [
+        f"a{i}.md" for i in range(50 - H._LIST_LIMITS["artifacts_created"], 50)
+    ]
+
+
+def test_read_tail_does_not_consume_partial_last_line(tmp_path):
+    path = tmp_path / "t.jsonl"
+    path.write_bytes(b"one\ntwo\npart")
+    lines, end = H.read_tail(path, 10)
+    assert lines == ["one", "two", "part"]
+    assert end == len(b"one\ntwo\n")
+    path.write_bytes(b"partial")
+    assert H.read_tail(path, 10, offset=0) == (["partial"], 0)
+
+
+def test_incremental_extraction_rereads_line_finished_after_last_run(tmp_path):
+    path = tmp_path / "t.jsonl"
+    full = _line("issue #7 in MAP-PLAN") + "\n"
+    later = _line("now in PATCH, updated c/d.py") + "\n"
+    path.write_text(full + later[:10])
+    offsets: dict = {}
+    H.extract_incremental(path, "s1", offsets)
+    assert offsets["s1"]["offset"] == len(full.encode())
+
+    path.write_text(full + later)
+    state = H.extract_incremental(path, "s1", offsets)
+    assert state["last_phase"] == "PATCH"
+    assert state["files_modified"] == ["c/d.py"]
+
+
+def test_incremental_extraction_rereads_truncated_transcript(tmp_path):
+    path = tmp_path / "t.jsonl"
+    path.write_text(_line("issue #7") + "\n" + _line("issue #8") + "\n")
+    offsets: dict = {}
+    H.extract_incremental(path, "s1", offsets)
+    path.write_text(_line("issue #3") + "\n")
+    assert H.extract_incremental(path, "s1", offsets)["last_issue"] == 3
+
+
+def test_offsets_round_trip(tmp_path):
+    offsets = {"s1": {"size": 1, "mtime": 9e12, "offset": 1, "state": {}}, "old": {"mtime": 0}}
+    H.save_offsets(tmp_path, offsets, retention_days=7)
+    assert list(H.load_offsets(tmp_path)) == ["s1"]
+    assert [p.name for p in tmp_path.iterdir()] == [H.OFFSETS_FILE]
+    (tmp_path / H.OFFSETS_FILE).write_text("not json")
+    assert H.load_offsets(tmp_path) == {}
+
+
+def test_copy_transcript_is_a_snapshot(tmp_path):
+    src = tmp_path / "live.jsonl"
+    dst = tmp_path / "ckpt.jsonl"
+    src.write_bytes(b'{"content": "a"}\n')
+    H.copy_transcript(src, dst)
+    with src.open("ab") as f:
+        f.write(b'{"content": "b"}\n')
+    assert dst.read_bytes() == b'{"content": "a"}\n'
+
+
+def test_bounded_lists_keep_most_recent_five():
+    lines = [_line(f"- [ ] task {i}") for i in range(8)]
+    state = H.extract_state_from_transcript(lines)
+    assert state["pending_tasks"] == [f"task {i}" for i in range(3, 8)]
+
+
+def test_persistent_state_written_atomically(tmp_path):
+    import state_manager as sm
+
+    sm.update_from_extracted(tmp_path, {"last_issue": 12, "last_phase": "PROVE", "artifacts_created": ["x.md"]})
+    path = sm._state_path(tmp_path)
+    assert not path.with_suffix(".yaml.tmp").exists()
+    work = sm.load_state(tmp_path)["active_work"]
+    assert work == {"issue": 12, "phase": "PROVE", "last_action": "Created x.md"}
+
+
+def test_cleanup_removes_only_stale_checkpoints(tmp_path):
+    import os
+
+    stale = tmp_path / "20200101-000000__s__auto.md"
+    fresh = tmp_path / "20990101-000000__s__auto.transcript.jsonl"
+    keep = tmp_path / "PERSISTENT_STATE.yaml"
+    for p in (stale, fresh, keep):
+        p.write_text("x")
+    os.utime(stale, (0, 0))
+    os.utime(keep, (0, 0))
+    assert H.cleanup_old_checkpoints(tmp_path, retention_days=7) == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([fresh.name, keep.name])
+
+
+def test_render_summary_layout():
+    extracted = {
+        "last_issue": 3,
+        "last_phase": None,
+        "artifacts_created": ["a.md", "b.md"],
+        "pending_tasks": ["t1"],
+        "files_modified": [],
+        "key_decisions": ["d1", "d2"],
+    }
+    text = H.render_summary("20260101-000000", "sid", "auto", "x.jsonl", extracted)
+    assert text.endswith("## Key Decisions\n- d1\n- d2\n")
+    assert "- **Last Issue**: #3\n- **Last Phase**: None\n" in text
+    assert "## Pending Tasks\n- [ ] t1\n\n## Files Modified\n- None\n" in text
@@ -894,3 +894,31 @@ def test_ranking_fresh_feedback_beats_stale_project(tmp_path, monkeypatch):
     _fact(d, "new-feedback", ftype="feedback", body="F" * 500, mtime=now - 300)
     out = H.render_project_memory(d, today=TODAY)
     assert out.index("new-feedback") < out.index("old-project")
+
+
+# ---------------------------------------------------------------------------
+# get_active_work fast path
+# ---------------------------------------------------------------------------
+
+
+def test_active_work_fast_path_matches_yaml():
+    import yaml
+
+    cases = [
+        "active_work:\n  issue: 12\n  phase: PROVE\n  last_action: Created x.md\nmeta:\n  updated: '2026-01-01'\n",
+        "active_work:\n  issue: 12\n\n  branch: feat/x-1\nmeta:\n  updated: x\n",
+        "active_work:\n  issue: 3\n  completed_phases:\n  - MAP\n",
+        "active_work:\n  issue: 010\n  flag: on\n",
+        "active_work:\n  last_action: 'quoted: yes'\n",
+        "meta:\n  updated: x\n",
+    ]
+    for content in cases:
+        expected = (yaml.safe_load(content) or {}).get("active_work", {})
+        assert H.get_active_work(content) == expected, content
+
+
+def test_active_work_fast_path_bails_on_non_flat_values():
+    assert H._fast_active_work("active_work:\n  issue: 3\n  phase: PATCH\n") == {"issue": 3, "phase": "PATCH"}
+    assert H._fast_active_work("active_work:\n  phases:\n  - MAP\n") is None
+    assert H._fast_active_work("active_work:\n  ok: true\n") is None
+    assert H._fast_active_work("no state here\n") is None
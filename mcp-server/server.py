@@ -21,15 +21,6 @@ from __future__ import annotations
 import json
 import sys
 
-try:
-    from mcp.server import Server
-    from mcp.server.stdio import stdio_server
-    from mcp.types import Tool, TextContent
-
-    HAS_MCP = True
-except ImportError:
-    HAS_MCP = False
-
 from tools.vault_status import vault_status
 from tools.vault_search import vault_search
 from tools.vault_dashboard import vault_dashboard
@@ -152,8 +143,29 @@ def _build_registered_tools():
 REGISTERED_TOOLS = _build_registered_tools()
 
 
+def _has_mcp() -> bool:
+    """True when the MCP SDK imports cleanly.
+
+    Tried only on the server path, so the standalone CLI never loads it. A
+    broken install (missing dependency, partial package) counts as absent
+    and falls back to the CLI, like a missing one.
+    """
+    try:
+        import mcp.server
+        import mcp.server.stdio
+        import mcp.types  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
 async def run_mcp():
     """Run as MCP server."""
+    # Imported here so the standalone CLI never pays for loading the MCP SDK.
+    from mcp.server import Server
+    from mcp.server.stdio import stdio_server
+    from mcp.types import TextContent, Tool
+
     server = Server("vault-metrics")
 
     @server.list_tools()
@@ -187,7 +199,7 @@ async def run_mcp():
 
 
 if __name__ == "__main__":
-    if not HAS_MCP or (len(sys.argv) > 1 and sys.argv[1] != "--mcp"):
+    if (len(sys.argv) > 1 and sys.argv[1] != "--mcp") or not _has_mcp():
         run_standalone()
     else:
         import asyncio
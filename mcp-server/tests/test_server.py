@@ -0,0 +1,21 @@
+"""Tests for server.py — MCP availability check."""
+from __future__ import annotations
+
+import sys
+import types
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import server
+
+
+def test_missing_mcp_falls_back_to_cli(monkeypatch):
+    monkeypatch.setitem(sys.modules, "mcp", None)
+    assert server._has_mcp() is False
+
+
+def test_broken_mcp_install_falls_back_to_cli(monkeypatch):
+    # The package is there but one of its submodules fails to import
+    monkeypatch.setitem(sys.modules, "mcp", types.ModuleType("mcp"))
+    monkeypatch.setitem(sys.modules, "mcp.server", None)
+    assert server._has_mcp() is False
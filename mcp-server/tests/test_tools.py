@@ -0,0 +1,149 @@
+"""End-to-end tests for the vault and metrics tools on a small fixture.
+
+Expected values were worked out by hand from the fixture; they pin the
+tools' output shape, ordering and filtering rules.
+"""
+from __future__ import annotations
+
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from tools.agent_metrics import agent_metrics
+from tools.failure_patterns import failure_patterns
+from tools.vault_dashboard import vault_dashboard
+from tools.vault_status import vault_status
+
+STATUS_MD = """\
+# alpha
+
+## Status
+Shipping the parser rewrite
+
+## Next Steps
+- [x] land tokenizer
+- [ ] wire CLI
+not an item
+
+## Blockers
+- None
+- waiting on review
+
+## Recent Activity
+- 2026-01-02 merged #12
+"""
+
+
+@pytest.fixture
+def vault(tmp_path, monkeypatch):
+    root = tmp_path / "vault"
+    (root / "Projects" / "alpha" / "Log" / "Daily").mkdir(parents=True)
+    (root / "Projects" / "alpha" / "STATUS.md").write_text(STATUS_MD, encoding="utf-8")
+    (root / "Projects" / "beta").mkdir()
+    (root / "Projects" / ".hidden").mkdir()
+    (root / "Projects" / "README.md").write_text("not a project", encoding="utf-8")
+    monkeypatch.setenv("OBSIDIAN_VAULT_PATH", str(root))
+    return root
+
+
+def _write_jsonl(path: Path, records: list) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = [r if isinstance(r, str) else json.dumps(r) for r in records]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_vault_status_sections(vault):
+    result = vault_status("alpha")
+    assert result["status"] == "Shipping the parser rewrite"
+    assert result["next_steps"] == [
+        {"done": True, "text": "land tokenizer"},
+        {"done": False, "text": "wire CLI"},
+    ]
+    assert result["blockers"] == ["waiting on review"]
+    assert result["recent_activity"] == ["2026-01-02 merged #12"]
+    assert "error" in vault_status("missing")
+
+
+def test_vault_status_sees_edits(vault):
+    assert vault_status("alpha")["status"] == "Shipping the parser rewrite"
+    status = vault / "Projects" / "alpha" / "STATUS.md"
+    status.write_text(STATUS_MD.replace("Shipping the parser rewrite", "Paused"), encoding="utf-8")
+    assert vault_status("alpha")["status"] == "Paused"
+
+
+def test_vault_status_result_is_a_copy(vault):
+    vault_status("alpha")["blockers"].append("mutated")
+    assert vault_status("alpha")["blockers"] == ["waiting on review"]
+
+
+def test_vault_dashboard_directory_scan(vault):
+    result = vault_dashboard()
+    assert result["source"] == "directory_scan"
+    assert result["projects"] == [
+        {"name": "alpha", "status": "Shipping the parser rewrite", "has_status_md": True, "has_daily_logs": True},
+        {"name": "beta", "status": None, "has_status_md": False, "has_daily_logs": False},
+    ]
+    assert result["total_projects"] == 2
+
+
+def test_vault_dashboard_reads_dashboard_md(vault):
+    (vault / "DASHBOARD.md").write_text(
+        "# Dashboard\n## alpha\n- on track\n- detail one\n### beta\n-   \n- second\n", encoding="utf-8"
+    )
+    result = vault_dashboard()
+    assert result["source"] == "DASHBOARD.md"
+    assert result["projects"] == [
+        {"name": "alpha", "status": "on track", "details": ["detail one"]},
+        {"name": "beta", "status": "second", "details": [""]},
+    ]
+
+
+def test_agent_metrics_window_and_breakdowns(tmp_path):
+    today = datetime.now()
+    recent = (today - timedelta(days=2)).strftime("%Y-%m-%d")
+    old = (today - timedelta(days=60)).strftime("%Y-%m-%d")
+    _write_jsonl(tmp_path / ".claude" / "memory" / "metrics.jsonl", [
+        {"date": recent, "status": "PASS", "complexity": "SIMPLE", "stack": "python"},
+        {"date": recent, "status": "BLOCKED", "complexity": "SIMPLE", "stack": "python",
+         "root_cause": "flaky", "tier_corrected_to": "COMPLEX"},
+        {"date": recent, "status": "BLOCKED", "complexity": "COMPLEX", "root_cause": "flaky"},
+        {"date": old, "status": "PASS", "complexity": "SIMPLE", "stack": "python"},
+        {"status": "PASS"},
+        "not json",
+        "",
+    ])
+    result = agent_metrics("30d", str(tmp_path))
+    assert result["overall"] == {"total": 3, "passed": 1, "blocked": 2, "success_rate": 0.333}
+    assert result["by_complexity"] == {
+        "COMPLEX": {"pass": 0, "total": 1, "rate": 0.0},
+        "SIMPLE": {"pass": 1, "total": 2, "rate": 0.5},
+    }
+    assert result["by_stack"] == {
+        "python": {"pass": 1, "total": 2, "rate": 0.5},
+        "unknown": {"pass": 0, "total": 1, "rate": 0.0},
+    }
+    assert result["top_failures"] == [{"cause": "flaky", "count": 2}]
+    assert result["per_host_re_tier_rate"]["SIMPLE"] == {"retier_count": 1, "total": 2, "rate": 0.5}
+
+    assert agent_metrics("all", str(tmp_path))["total_records"] == 5
+    assert "error" in agent_metrics("30d", str(tmp_path / "nowhere"))
+
+
+def test_failure_patterns_grouping(tmp_path):
+    _write_jsonl(tmp_path / ".claude" / "memory" / "failures.jsonl", [
+        {"root_cause": "types", "date": "2026-01-01", "issue": 1, "files": ["a.py", "b.py"]},
+        {"root_cause": "types", "date": "2026-01-03", "issue": 2, "files": ["a.py"], "details": "x" * 300},
+        {"date": "2026-01-02", "issue": 3},
+    ])
+    result = failure_patterns(str(tmp_path))
+    assert result["total_failures"] == 3
+    assert [p["root_cause"] for p in result["patterns"]] == ["types", "UNKNOWN"]
+    types = result["patterns"][0]
+    assert types["percentage"] == 66.7
+    assert types["common_files"] == [{"file": "a.py", "count": 2}, {"file": "b.py", "count": 1}]
+    assert [ex["issue"] for ex in types["recent_examples"]] == [2, 1]
+    assert len(types["recent_examples"][0]["details"]) == 200
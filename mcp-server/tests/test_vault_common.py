@@ -0,0 +1,88 @@
+"""Tests for tools/vault_common.py — shared caches and JSONL reading."""
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from tools.vault_common import iter_jsonl, list_projects, mtime_cached
+
+
+def _counting_parser():
+    calls = []
+
+    @mtime_cached()
+    def parse(path: Path, suffix: str) -> dict:
+        calls.append((path.name, suffix))
+        return {"text": path.read_text() + suffix, "items": [1]}
+
+    return parse, calls
+
+
+def test_mtime_cached_hits_until_file_changes(tmp_path):
+    parse, calls = _counting_parser()
+    path = tmp_path / "f.md"
+    path.write_text("one")
+    assert parse(path, "!") == {"text": "one!", "items": [1]}
+    assert parse(path, "!")["text"] == "one!"
+    assert calls == [("f.md", "!")]
+
+    # Extra arguments are part of the key
+    assert parse(path, "?")["text"] == "one?"
+    assert len(calls) == 2
+
+    # Same size, new mtime: miss
+    path.write_text("two")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert parse(path, "!")["text"] == "two!"
+    assert len(calls) == 3
+
+
+def test_mtime_cached_returns_copies(tmp_path):
+    parse, calls = _counting_parser()
+    path = tmp_path / "f.md"
+    path.write_text("x")
+    parse(path, "")["items"].append(2)
+    assert parse(path, "")["items"] == [1]
+    assert len(calls) == 1
+
+
+def test_mtime_cached_cache_clear(tmp_path):
+    parse, calls = _counting_parser()
+    path = tmp_path / "f.md"
+    path.write_text("x")
+    parse(path, "")
+    parse.cache_clear()
+    parse(path, "")
+    assert len(calls) == 2
+
+
+def test_list_projects_skips_hidden_and_files(tmp_path):
+    for name in ("beta", "alpha", ".obsidian"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "notes.md").write_text("")
+    assert list_projects(tmp_path) == ("alpha", "beta")
+
+
+def test_list_projects_refreshes_when_directory_changes(tmp_path):
+    (tmp_path / "alpha").mkdir()
+    assert list_projects(tmp_path) == ("alpha",)
+    (tmp_path / "gamma").mkdir()
+    st = tmp_path.stat()
+    os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert list_projects(tmp_path) == ("alpha", "gamma")
+
+
+def test_iter_jsonl_skips_blank_and_malformed_lines(tmp_path):
+    path = tmp_path / "m.jsonl"
+    path.write_bytes(b'{"a": 1}\n\n  \nnot json\n{"a": 2}\n{"a": "\xff"}\n{"a": 3}')
+    assert [r["a"] for r in iter_jsonl(path)] == [1, 2, 3]
+    assert [r["a"] for r in iter_jsonl(path, skip=lambda line: b"2" in line)] == [1, 3]
+
+
+def test_iter_jsonl_empty_file(tmp_path):
+    path = tmp_path / "m.jsonl"
+    path.write_bytes(b"")
+    assert list(iter_jsonl(path)) == []
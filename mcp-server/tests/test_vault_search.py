@@ -0,0 +1,79 @@
+"""Tests for tools/vault_search.py — daily log search."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from tools.vault_search import vault_search
+
+
+@pytest.fixture
+def vault(tmp_path, monkeypatch):
+    monkeypatch.setenv("OBSIDIAN_VAULT_PATH", str(tmp_path))
+    return tmp_path
+
+
+def _daily(vault: Path, project: str, date: str, text: str) -> Path:
+    daily = vault / "Projects" / project / "Log" / "Daily"
+    daily.mkdir(parents=True, exist_ok=True)
+    path = daily / f"{date}.md"
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def _lines(result: dict) -> list[tuple[str, str, int, str]]:
+    return [
+        (m["project"], m["date"], line["line_number"], line["text"])
+        for m in result["matches"]
+        for line in m["lines"]
+    ]
+
+
+def test_matches_lines_case_insensitively_newest_first(vault):
+    _daily(vault, "alpha", "2026-01-01", "nothing\n  Fixed the Parser  \n")
+    _daily(vault, "alpha", "2026-01-02", "parser one\nother\nPARSER two")
+    _daily(vault, "beta", "2026-01-01", "no hit here\n")
+    _daily(vault, "alpha", "notes", "parser in a non-daily file\n")
+    result = vault_search("parser")
+    assert _lines(result) == [
+        ("alpha", "2026-01-02", 1, "parser one"),
+        ("alpha", "2026-01-02", 3, "PARSER two"),
+        ("alpha", "2026-01-01", 2, "Fixed the Parser"),
+    ]
+    assert result["total_matches"] == 2
+
+
+def test_uses_regex_ignorecase_rules_not_casefold(vault):
+    # re.IGNORECASE matches "i" against "İ" and never expands "ß" to "SS";
+    # casefold() disagrees on both.
+    _daily(vault, "alpha", "2026-01-01", "İstanbul\nistanbul\nSTRASSE\nstraße\nSTRAßE\n")
+    assert [t for *_, t in _lines(vault_search("istanbul"))] == ["İstanbul", "istanbul"]
+    assert [t for *_, t in _lines(vault_search("straße"))] == ["straße", "STRAßE"]
+    assert [t for *_, t in _lines(vault_search("strasse"))] == ["STRASSE"]
+
+
+def test_query_is_literal_and_never_spans_lines(vault):
+    _daily(vault, "alpha", "2026-01-01", "a.b\naxb\nend\nstart\n")
+    assert [t for *_, t in _lines(vault_search("a.b"))] == ["a.b"]
+    assert vault_search("end\nstart")["matches"] == []
+
+
+def test_lines_per_file_are_capped(vault):
+    _daily(vault, "alpha", "2026-01-01", "hit\n" * 25)
+    (match,) = vault_search("hit")["matches"]
+    assert [line["line_number"] for line in match["lines"]] == list(range(1, 11))
+
+
+def test_scoped_to_one_project(vault):
+    _daily(vault, "alpha", "2026-01-01", "hit\n")
+    _daily(vault, "beta", "2026-01-01", "hit\n")
+    assert [m["project"] for m in vault_search("hit", project="beta")["matches"]] == ["beta"]
+
+
+def test_missing_projects_dir(vault):
+    result = vault_search("x")
+    assert result["matches"] == []
+    assert "error" in result
@@ -1,11 +1,15 @@
 """Query agent metrics from metrics.jsonl."""
 from __future__ import annotations
 
-import json
-from collections import defaultdict
+import re
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
+from pathlib import Path
 
-from .vault_common import get_project_memory_dir
+from .vault_common import get_project_memory_dir, iter_jsonl, mtime_cached
+
+# A plain (escape-free) string value of a "date" key in a raw JSONL line.
+_DATE_FIELD_RE = re.compile(rb'"date"\s*:\s*"([^"\\]*)"')
 
 
 def agent_metrics(period: str | None = None, project: str | None = None) -> dict:
@@ -31,62 +35,79 @@ def agent_metrics(period: str | None = None, project: str | None = None) -> dict
         days = int(period.rstrip("d"))
         cutoff_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
 
-    # Load records
-    records = []
-    for line in metrics_file.read_text(encoding="utf-8").strip().split("\n"):
-        if not line.strip():
-            continue
-        try:
-            record = json.loads(line)
-            if cutoff_date and record.get("date", "") < cutoff_date:
-                continue
-            records.append(record)
-        except json.JSONDecodeError:
-            continue
+    return _summarize(metrics_file, period, cutoff_date)
 
-    if not records:
-        return {"error": "No metrics records in period", "period": period}
 
-    # Calculate overall
-    total = len(records)
-    passed = sum(1 for r in records if r.get("status") == "PASS")
-    blocked = total - passed
+def _before_cutoff(cutoff: bytes):
+    """Build an iter_jsonl ``skip`` test for lines certainly dated before ``cutoff``.
 
-    # By complexity
-    by_complexity = defaultdict(lambda: {"pass": 0, "total": 0})
-    for r in records:
-        c = r.get("complexity", "UNKNOWN")
-        by_complexity[c]["total"] += 1
-        if r.get("status") == "PASS":
-            by_complexity[c]["pass"] += 1
-
-    # By stack
-    by_stack = defaultdict(lambda: {"pass": 0, "total": 0})
-    for r in records:
-        s = r.get("stack", "unknown")
-        by_stack[s]["total"] += 1
-        if r.get("status") == "PASS":
-            by_stack[s]["pass"] += 1
-
-    # Top failure causes
-    cause_counts = defaultdict(int)
-    for r in records:
-        if r.get("root_cause"):
-            cause_counts[r["root_cause"]] += 1
-
-    top_failures = sorted(cause_counts.items(), key=lambda x: -x[1])[:5]
+    It only answers True when the record would be filtered out after parsing
+    anyway: a line with no "date" key at all (``"" < cutoff``), or exactly one
+    whose value compares below the cutoff. UTF-8 byte order matches str
+    order, so the bytes comparison agrees with the post-parse one. Anything
+    ambiguous (several "date" keys, escaped values) falls through to a parse.
+    """
 
+    def skip(line: bytes) -> bool:
+        n = line.count(b'"date"')
+        if not n:
+            return True
+        if n > 1:
+            return False
+        m = _DATE_FIELD_RE.search(line)
+        return m is not None and m.group(1) < cutoff
+
+    return skip
+
+
+@mtime_cached()
+def _summarize(metrics_file: Path, period: str, cutoff_date: str | None) -> dict:
+    """Aggregate metrics.jsonl records dated on/after ``cutoff_date``."""
+    # Single pass: every aggregate is updated as each record streams in, so no
+    # record list is held and the records are walked once, not four times.
+    total = 0
+    passed = 0
+    # Plain list counters: one small list per key and index arithmetic in the
+    # loop instead of a dict per key and two key lookups per update.
+    by_complexity = defaultdict(lambda: [0, 0, 0])  # [pass, total, retier_count]
+    by_stack = defaultdict(lambda: [0, 0])  # [pass, total]
+    cause_counts = Counter()
     # Per-host re-tier rate. NOTE: "per-host" = THIS host only — the source is the
     # local rollup (~/.claude/memory/metrics.jsonl), not a cross-machine view. The
     # breakdown is grouped by ORIGINAL complexity tier (how often a tier got
     # re-classified mid-flight), NOT by machine. Cross-fleet segmentation is REC 0.1.
-    by_complexity_retier: dict = defaultdict(lambda: {"retier_count": 0, "total": 0})
-    for r in records:
-        c = r.get("complexity", "UNKNOWN")
-        by_complexity_retier[c]["total"] += 1
-        corrected = r.get("tier_corrected_to")
+    # It shares by_complexity's keys and totals, so it rides in slot 2 there.
+
+    # Out-of-window records are dropped from the raw bytes, before parsing.
+    skip = _before_cutoff(cutoff_date.encode()) if cutoff_date else None
+    for r in iter_jsonl(metrics_file, skip):
+        get = r.get  # bound once per record; each field below is one call
+        if cutoff_date and get("date", "") < cutoff_date:
+            continue
+        is_pass = get("status") == "PASS"
+        total += 1
+        passed += is_pass
+
+        c = get("complexity", "UNKNOWN")
+        ec = by_complexity[c]
+        ec[0] += is_pass
+        ec[1] += 1
+        corrected = get("tier_corrected_to")
         if corrected and corrected != c:
-            by_complexity_retier[c]["retier_count"] += 1
+            ec[2] += 1
+
+        es = by_stack[get("stack", "unknown")]
+        es[0] += is_pass
+        es[1] += 1
+
+        if cause := get("root_cause"):
+            cause_counts[cause] += 1
+
+    if not total:
+        return {"error": "No metrics records in period", "period": period}
+
+    blocked = total - passed
+    top_failures = cause_counts.most_common(5)
 
     return {
         "period": period,
@@ -98,19 +119,16 @@ def agent_metrics(period: str | None = None, project: str | None = None) -> dict
             "success_rate": round(passed / total, 3) if total else 0,
         },
         "by_complexity": {
-            k: {**v, "rate": round(v["pass"] / v["total"], 3) if v["total"] else 0}
-            for k, v in sorted(by_complexity.items())
+            k: {"pass": p, "total": n, "rate": round(p / n, 3) if n else 0}
+            for k, (p, n, _) in sorted(by_complexity.items())
         },
         "by_stack": {
-            k: {**v, "rate": round(v["pass"] / v["total"], 3) if v["total"] else 0}
-            for k, v in sorted(by_stack.items())
+            k: {"pass": p, "total": n, "rate": round(p / n, 3) if n else 0}
+            for k, (p, n) in sorted(by_stack.items())
         },
         "top_failures": [{"cause": c, "count": n} for c, n in top_failures],
         "per_host_re_tier_rate": {
-            k: {
-                **v,
-                "rate": round(v["retier_count"] / v["total"], 3) if v["total"] else 0,
-            }
-            for k, v in sorted(by_complexity_retier.items())
+            k: {"retier_count": rt, "total": n, "rate": round(rt / n, 3) if n else 0}
+            for k, (_, n, rt) in sorted(by_complexity.items())
         },
     }
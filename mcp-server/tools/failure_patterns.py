@@ -1,10 +1,14 @@
 """Read failures.jsonl and extract top patterns."""
 from __future__ import annotations
 
-import json
-from collections import defaultdict
+import heapq
+from collections import Counter, defaultdict
+from operator import itemgetter, methodcaller
+from pathlib import Path
 
-from .vault_common import get_project_memory_dir
+from .vault_common import get_project_memory_dir, iter_jsonl, mtime_cached
+
+_by_date = methodcaller("get", "date", "")
 
 
 def failure_patterns(project: str | None = None) -> dict:
@@ -22,42 +26,44 @@ def failure_patterns(project: str | None = None) -> dict:
     if not failures_file.exists():
         return {"error": "No failures data found", "path": str(failures_file)}
 
-    # Load records
-    records = []
-    for line in failures_file.read_text(encoding="utf-8").strip().split("\n"):
-        if not line.strip():
-            continue
-        try:
-            records.append(json.loads(line))
-        except json.JSONDecodeError:
-            continue
-
-    if not records:
-        return {"error": "No failure records found", "total": 0}
+    return _summarize(failures_file)
+
 
-    # Group by root cause
+@mtime_cached()
+def _summarize(failures_file: Path) -> dict:
+    """Group failures.jsonl records into patterns by root cause."""
+    # Group by root cause as records stream in
     by_cause = defaultdict(list)
-    for r in records:
-        cause = r.get("root_cause", "UNKNOWN")
-        by_cause[cause].append(r)
+    by_cause_getitem = by_cause.__getitem__
+    total = 0
+    for r in iter_jsonl(failures_file):
+        by_cause_getitem(r.get("root_cause", "UNKNOWN")).append(r)
+        total += 1
+
+    if not total:
+        return {"error": "No failure records found", "total": 0}
 
-    # Build patterns
+    # Build patterns. Only the top few files/examples per cause are kept, so
+    # heapq.nlargest (O(n log k)) replaces full sorts that were sliced anyway.
+    # Sort keys are C callables (itemgetter/methodcaller/dict lookups) rather
+    # than lambdas, so no Python frame runs per key.
+    sizes = {cause: len(failures) for cause, failures in by_cause.items()}
     patterns = []
-    for cause, failures in sorted(by_cause.items(), key=lambda x: -len(x[1])):
+    for cause in sorted(sizes, key=sizes.__getitem__, reverse=True):
+        failures = by_cause[cause]
         # Get common files
-        file_counts = defaultdict(int)
+        file_counts = Counter()
         for f in failures:
-            for filepath in f.get("files", []):
-                file_counts[filepath] += 1
-        top_files = sorted(file_counts.items(), key=lambda x: -x[1])[:5]
+            file_counts.update(f.get("files") or ())
+        top_files = heapq.nlargest(5, file_counts.items(), key=itemgetter(1))
 
         # Get most recent examples
-        recent = sorted(failures, key=lambda x: x.get("date", ""), reverse=True)[:3]
+        recent = heapq.nlargest(3, failures, key=_by_date)
 
         patterns.append({
             "root_cause": cause,
             "count": len(failures),
-            "percentage": round(len(failures) / len(records) * 100, 1),
+            "percentage": round(len(failures) / total * 100, 1),
             "common_files": [{"file": f, "count": c} for f, c in top_files],
             "recent_examples": [
                 {
@@ -71,7 +77,7 @@ def failure_patterns(project: str | None = None) -> dict:
         })
 
     return {
-        "total_failures": len(records),
+        "total_failures": total,
         "unique_causes": len(patterns),
         "patterns": patterns,
     }
@@ -1,10 +1,24 @@
 """Shared utilities for vault access."""
 from __future__ import annotations
 
+import copy
+import functools
+import json
+import mmap
 import os
 import platform
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
+try:
+    import orjson
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    # keep catching the stdlib type on either path.
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 
 def get_vault_path() -> Path:
     """Get Obsidian vault path from environment or platform default."""
@@ -29,3 +43,70 @@ def get_project_memory_dir(project_path: str | None = None) -> Path:
         return Path(proj_dir) / ".claude" / "memory"
 
     return Path.cwd() / ".claude" / "memory"
+
+
+def list_projects(projects_dir: Path) -> tuple[str, ...]:
+    """Return the sorted names of the project directories under ``projects_dir``.
+
+    Keyed on the directory's mtime, which moves whenever an entry is added,
+    removed or renamed, so vault_search and vault_dashboard share a single
+    listing until the set of projects actually changes.
+    """
+    return _list_projects(str(projects_dir), os.stat(projects_dir).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _list_projects(projects_dir_str: str, mtime_ns: int) -> tuple[str, ...]:
+    # DirEntry.is_dir() answers from the directory listing (d_type), no stat
+    with os.scandir(projects_dir_str) as entries:
+        return tuple(sorted(e.name for e in entries if not e.name.startswith(".") and e.is_dir()))
+
+
+def iter_jsonl(path: Path, skip: Callable[[bytes], bool] | None = None) -> Iterator[dict]:
+    """Yield records from a JSONL file, skipping blank and malformed lines.
+
+    ``skip``, if given, sees each raw line before it is parsed; lines it
+    returns True for are dropped without paying for the JSON decode.
+
+    The file is mmapped, so lines are read straight out of the page cache
+    with no whole-file read into a heap buffer and no decode pass. Both
+    orjson and stdlib json accept the bytes directly. mmap.readline already
+    finds each newline with a C memchr, so the loop does nothing per line
+    beyond the parse itself: blank lines fail to parse like any other
+    malformed line instead of being stripped and tested up front.
+    """
+    with path.open("rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                if skip is not None and skip(line):
+                    continue
+                try:
+                    yield json_loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+
+
+def mtime_cached(maxsize: int = 64) -> Callable:
+    """Memoize ``fn(path, *args)`` keyed on (path, mtime_ns, size, *args).
+
+    Tools are called repeatedly with the same arguments during a session; the
+    stat key drops a stale entry the moment the file changes. Results are
+    deep-copied on the way out so callers cannot mutate the cached value.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.lru_cache(maxsize=maxsize)
+        def cached(path_str: str, mtime_ns: int, size: int, *args):
+            return fn(Path(path_str), *args)
+
+        @functools.wraps(fn)
+        def wrapper(path: Path, *args):
+            st = os.stat(path)
+            return copy.deepcopy(cached(str(path), st.st_mtime_ns, st.st_size, *args))
+
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+
+    return decorator
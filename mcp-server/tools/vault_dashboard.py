@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import re
+from pathlib import Path
 
-from .vault_common import get_vault_path
+from .vault_common import get_vault_path, list_projects, mtime_cached
+
+_PROJ_HEADER_RE = re.compile(r"^###?\s+(.+)$")
 
 
 def vault_dashboard() -> dict:
@@ -22,51 +25,69 @@ def vault_dashboard() -> dict:
 
     # Try reading DASHBOARD.md first
     if dashboard_file.exists():
-        content = dashboard_file.read_text(encoding="utf-8")
         result["source"] = "DASHBOARD.md"
-
-        # Parse project entries from dashboard
-        current_project = None
-        for line in content.split("\n"):
-            proj_match = re.match(r"^###?\s+(.+)$", line)
-            if proj_match:
-                current_project = proj_match.group(1).strip()
-                result["projects"].append({
-                    "name": current_project,
-                    "status": None,
-                    "details": [],
-                })
-                continue
-
-            if current_project and line.strip().startswith("-"):
-                text = line.strip().lstrip("- ").strip()
-                if result["projects"]:
-                    if result["projects"][-1]["status"] is None and text:
-                        result["projects"][-1]["status"] = text
-                    else:
-                        result["projects"][-1]["details"].append(text)
+        result["projects"] = _parse_dashboard(dashboard_file)
     else:
         # Fallback: scan Projects/ directory
         result["source"] = "directory_scan"
         projects_dir = vault / "Projects"
         if projects_dir.exists():
-            for proj_dir in sorted(projects_dir.iterdir()):
-                if proj_dir.is_dir() and not proj_dir.name.startswith("."):
-                    status_file = proj_dir / "STATUS.md"
-                    status_text = None
-                    if status_file.exists():
-                        # Read first non-empty, non-heading line
-                        for sline in status_file.read_text(encoding="utf-8").split("\n"):
-                            if sline.strip() and not sline.startswith("#"):
-                                status_text = sline.strip()
-                                break
-
-                    result["projects"].append({
-                        "name": proj_dir.name,
-                        "status": status_text,
-                        "has_status_md": status_file.exists(),
-                        "has_daily_logs": (proj_dir / "Log" / "Daily").exists(),
-                    })
+            for name in list_projects(projects_dir):
+                proj_dir = projects_dir / name
+                has_status_md, status_text = _status_summary(proj_dir / "STATUS.md")
+                result["projects"].append({
+                    "name": proj_dir.name,
+                    "status": status_text,
+                    "has_status_md": has_status_md,
+                    "has_daily_logs": (proj_dir / "Log" / "Daily").exists(),
+                })
 
     result["total_projects"] = len(result["projects"])
     return result
+
+
+def _status_summary(status_file: Path) -> tuple[bool, str | None]:
+    """Return (exists, first non-empty non-heading line) for a STATUS.md.
+
+    The open doubles as the existence check, and the file is read line by
+    line only up to the summary instead of being loaded whole.
+    """
+    try:
+        fh = status_file.open(encoding="utf-8")
+    except FileNotFoundError:
+        return False, None
+    with fh:
+        for sline in fh:
+            if sline.strip() and not sline.startswith("#"):
+                return True, sline.strip()
+    return True, None
+
+
+@mtime_cached()
+def _parse_dashboard(dashboard_file: Path) -> list[dict]:
+    """Parse DASHBOARD.md headings and bullets into project entries."""
+    projects: list[dict] = []
+    content = dashboard_file.read_text(encoding="utf-8")
+
+    # Parse project entries from dashboard
+    current_project = None
+    for line in content.split("\n"):
+        proj_match = _PROJ_HEADER_RE.match(line)
+        if proj_match:
+            current_project = proj_match.group(1).strip()
+            projects.append({
+                "name": current_project,
+                "status": None,
+                "details": [],
+            })
+            continue
+
+        if current_project and line.strip().startswith("-"):
+            text = line.strip().lstrip("- ").strip()
+            if projects:
+                if projects[-1]["status"] is None and text:
+                    projects[-1]["status"] = text
+                else:
+                    projects[-1]["details"].append(text)
+
+    return projects
@@ -1,9 +1,50 @@
 """Search daily logs in Obsidian vault."""
 from __future__ import annotations
 
+import os
 import re
-
-from .vault_common import get_vault_path
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from pathlib import Path
+
+from .vault_common import get_vault_path, list_projects
+
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+_LINES_PER_FILE = 10
+
+
+def _scan_log(log_file: Path, pattern: re.Pattern[str], limit: int = _LINES_PER_FILE) -> list[dict]:
+    """Return up to ``limit`` lines of one daily log that ``pattern`` matches."""
+    content = log_file.read_text(encoding="utf-8")
+    # Whole-file pre-filter: most logs don't mention the query at all. A
+    # query spanning a newline can never match within a single line.
+    match = pattern.search(content)
+    if match is None or "\n" in pattern.pattern:
+        return []
+
+    # Jump from hit to hit with pattern.search and count the newlines skipped
+    # in between, instead of splitting and testing every line of the file.
+    # The pattern is a literal without newlines, so every match in the file
+    # lies inside one line and the first match at or after a line start is
+    # in the first matching line.
+    hits = []
+    line_no, line_start = 1, 0
+    while match is not None and len(hits) < limit:
+        pos = match.start()
+        skipped = content.count("\n", line_start, pos)
+        if skipped:
+            line_no += skipped
+            line_start = content.rfind("\n", line_start, pos) + 1
+        line_end = content.find("\n", pos)
+        if line_end < 0:
+            line_end = len(content)
+        hits.append({"line_number": line_no, "text": content[line_start:line_end].strip()})
+        if line_end == len(content):
+            break
+        line_no, line_start = line_no + 1, line_end + 1
+        match = pattern.search(content, line_start)
+    return hits
 
 
 def vault_search(query: str, project: str | None = None) -> dict:
@@ -28,10 +69,13 @@ def vault_search(query: str, project: str | None = None) -> dict:
     if project:
         project_dirs = [projects_dir / project]
     else:
-        project_dirs = [d for d in projects_dir.iterdir() if d.is_dir() and not d.name.startswith(".")]
+        project_dirs = [projects_dir / name for name in list_projects(projects_dir)]
 
     pattern = re.compile(re.escape(query), re.IGNORECASE)
 
+    # Enumerate every candidate log first (cheap), then read + scan them on a
+    # thread pool: the work is file I/O and the files are independent.
+    tasks = []
     for proj_dir in sorted(project_dirs):
         if not proj_dir.exists():
             continue
@@ -40,29 +84,32 @@ def vault_search(query: str, project: str | None = None) -> dict:
         if not daily_dir.exists():
             continue
 
-        for log_file in sorted(daily_dir.glob("*.md"), reverse=True):
-            date_str = log_file.stem
-            if not re.match(r"^\d{4}-\d{2}-\d{2}$", date_str):
-                continue
-
-            content = log_file.read_text(encoding="utf-8")
-            matching_lines = []
-            for i, line in enumerate(content.split("\n"), 1):
-                if pattern.search(line):
-                    matching_lines.append({"line_number": i, "text": line.strip()})
-
-            if matching_lines:
-                results["matches"].append({
-                    "project": proj_dir.name,
-                    "date": date_str,
-                    "file": str(log_file),
-                    "lines": matching_lines[:10],  # Limit per file
-                })
-
-        # Limit total results
-        if len(results["matches"]) > 50:
-            results["truncated"] = True
-            break
+        with os.scandir(daily_dir) as entries:
+            names = [e.name for e in entries if e.name.endswith(".md") and _DATE_RE.match(e.name[:-3])]
+        for name in sorted(names, reverse=True):
+            tasks.append((proj_dir.name, daily_dir / name))
+
+    workers = min(_MAX_WORKERS, len(tasks)) or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        scanned = pool.map(lambda task: _scan_log(task[1], pattern), tasks)
+
+        # Aggregate in project order; executor.map preserves task order.
+        by_project = groupby(zip(tasks, scanned), key=lambda item: item[0][0])
+        for proj_name, items in by_project:
+            for (_, log_file), matching_lines in items:
+                if matching_lines:
+                    results["matches"].append({
+                        "project": proj_name,
+                        "date": log_file.stem,
+                        "file": str(log_file),
+                        "lines": matching_lines,  # capped at _LINES_PER_FILE
+                    })
+
+            # Limit total results
+            if len(results["matches"]) > 50:
+                results["truncated"] = True
+                pool.shutdown(wait=False, cancel_futures=True)
+                break
 
     results["total_matches"] = len(results["matches"])
     return results
@@ -2,8 +2,19 @@
 from __future__ import annotations
 
 import re
+from pathlib import Path
 
-from .vault_common import get_vault_path
+from .vault_common import get_vault_path, mtime_cached
+
+_SECTION_RES = (
+    (re.compile(r"^##\s+Status", re.IGNORECASE), "status"),
+    (re.compile(r"^##\s+Next\s+Steps", re.IGNORECASE), "next_steps"),
+    (re.compile(r"^##\s+Blockers?", re.IGNORECASE), "blockers"),
+    (re.compile(r"^##\s+Recent\s+Activity", re.IGNORECASE), "recent_activity"),
+)
+_ANY_H2_RE = re.compile(r"^##\s+")
+_NEXT_ITEM_RE = re.compile(r"^-\s+\[([x ])\]\s+(.+)$")
+_DASH_ITEM_RE = re.compile(r"^-\s+(.+)$")
 
 
 def vault_status(project: str) -> dict:
@@ -21,6 +32,12 @@ def vault_status(project: str) -> dict:
     if not status_file.exists():
         return {"error": f"STATUS.md not found for project '{project}'", "path": str(status_file)}
 
+    return _parse_status(status_file, project)
+
+
+@mtime_cached()
+def _parse_status(status_file: Path, project: str) -> dict:
+    """Parse a STATUS.md into its status / next steps / blockers / activity."""
     content = status_file.read_text(encoding="utf-8")
     result = {
         "project": project,
@@ -34,20 +51,10 @@ def vault_status(project: str) -> dict:
     current_section = None
     for line in content.split("\n"):
         # Detect sections
-        if re.match(r"^##\s+Status", line, re.I):
-            current_section = "status"
-            continue
-        elif re.match(r"^##\s+Next\s+Steps", line, re.I):
-            current_section = "next_steps"
-            continue
-        elif re.match(r"^##\s+Blockers?", line, re.I):
-            current_section = "blockers"
-            continue
-        elif re.match(r"^##\s+Recent\s+Activity", line, re.I):
-            current_section = "recent_activity"
-            continue
-        elif re.match(r"^##\s+", line):
-            current_section = None
+        if _ANY_H2_RE.match(line):
+            current_section = next(
+                (name for regex, name in _SECTION_RES if regex.match(line)), None
+            )
             continue
 
         # Parse content
@@ -55,20 +62,20 @@ def vault_status(project: str) -> dict:
             if result["status"] is None:
                 result["status"] = line.strip()
         elif current_section == "next_steps":
-            m = re.match(r"^-\s+\[([x ])\]\s+(.+)$", line)
+            m = _NEXT_ITEM_RE.match(line)
             if m:
                 result["next_steps"].append({
                     "done": m.group(1) == "x",
                     "text": m.group(2).strip(),
                 })
         elif current_section == "blockers":
-            m = re.match(r"^-\s+(.+)$", line)
+            m = _DASH_ITEM_RE.match(line)
             if m:
                 text = m.group(1).strip()
                 if text.lower() not in ("none", "(none)", "n/a"):
                     result["blockers"].append(text)
         elif current_section == "recent_activity":
-            m = re.match(r"^-\s+(.+)$", line)
+            m = _DASH_ITEM_RE.match(line)
             if m:
                 result["recent_activity"].append(m.group(1).strip())
 
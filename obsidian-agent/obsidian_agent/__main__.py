@@ -1,5 +1,6 @@
 """CLI entry point: python -m obsidian_agent"""
 import argparse
+import json
 import os
 import subprocess
 import sys
@@ -9,19 +10,15 @@ from pathlib import Path
 
 from . import __version__
 from .config import load_config, init_config
-from .extractor import extract_with_claude
-from .parser import parse_session_log, get_conversation_text
-from .session_finder import (
-    get_current_session_log,
-    get_session_log_by_id,
-    get_session_log_by_project,
-    list_recent_projects,
-)
-from .git_helper import get_recent_commits
-from .vault_writer import VaultWriter
+
+# The extraction/vault modules (and what they pull in: subprocess pipelines,
+# orjson, concurrent.futures, ...) are imported inside the functions that use
+# them, so --version, --init and the installers start without loading them.
 
 CACHE_DIR = Path.home() / ".cache" / "obsidian-agent"
 LAST_RUN_FILE = CACHE_DIR / "last-run"
+# Session log path -> [mtime_ns, size] of the log when it was last written to the vault
+PROCESSED_FILE = CACHE_DIR / "processed.json"
 
 SYSTEMD_DIR = Path.home() / ".config" / "systemd" / "user"
 
@@ -92,6 +89,12 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Preview extraction without writing to vault",
     )
+    parser.add_argument(
+        "--skip-existing",
+        action="store_true",
+        help="Skip sessions already written to the vault whose log has not "
+        "changed since",
+    )
     parser.add_argument(
         "--since-last-run",
         action="store_true",
@@ -118,68 +121,217 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def _print_extract(extract):
-    """Pretty-print an extraction for dry-run."""
-    print(f"\n  Status:      {extract.status}")
-    print(f"  Phase:       {extract.phase}")
-    print(f"  Summary:     {extract.summary}")
+def _print_extract(extract, out: list[str]):
+    """Append the pretty-printed lines of an extraction for dry-run to out."""
+    out.append(f"\n  Status:      {extract.status}")
+    out.append(f"  Phase:       {extract.phase}")
+    out.append(f"  Summary:     {extract.summary}")
     if extract.completed_groups:
-        print("  Completed Groups:")
+        out.append("  Completed Groups:")
         for g in extract.completed_groups:
-            print(f"    {g.heading}:")
+            out.append(f"    {g.heading}:")
             for item in g.items:
-                print(f"      - {item}")
+                out.append(f"      - {item}")
     else:
-        print(f"  Completed:   {extract.completed}")
+        out.append(f"  Completed:   {extract.completed}")
     if extract.issues:
-        print("  Issues:")
+        out.append("  Issues:")
         for i in extract.issues:
-            print(f"    {i.number} {i.title} ({i.effort}) [{i.status}]")
+            out.append(f"    {i.number} {i.title} ({i.effort}) [{i.status}]")
     if extract.commits:
-        print("  Commits:")
+        out.append("  Commits:")
         for c in extract.commits:
-            print(f"    {c.hash} {c.message}")
-    print(f"  Next Steps:  {extract.next_steps}")
-    print(f"  Decisions:   {extract.decisions}")
-    print(f"  Blockers:    {extract.blockers}")
-    print(f"  GitHub Refs: {extract.github_refs}")
-    print(f"  Notes:       {extract.notes}")
-    print(f"  Knowledge:   {extract.knowledge}")
+            out.append(f"    {c.hash} {c.message}")
+    out.append(f"  Next Steps:  {extract.next_steps}")
+    out.append(f"  Decisions:   {extract.decisions}")
+    out.append(f"  Blockers:    {extract.blockers}")
+    out.append(f"  GitHub Refs: {extract.github_refs}")
+    out.append(f"  Notes:       {extract.notes}")
+    out.append(f"  Knowledge:   {extract.knowledge}")
 
 
-def _process_session(log_path, config, dry_run: bool):
-    """Parse, extract, and write a single session."""
-    print(f"Processing: {log_path}")
+def _emit(out: list[str]):
+    """Write collected output lines with a single write() instead of one per print."""
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
+
 
-    session = parse_session_log(log_path)
-    print(f"  Project:  {session.project_name}")
-    print(f"  Messages: {len(session.messages)}")
-    print(f"  Date:     {session.date}")
+def _prepare_session(log_path, config):
+    """Parse a session log and build the conversation text to extract from."""
+    from .parser import get_conversation_text, parse_session_log
+
+    out = [f"Processing: {log_path}"]
+    try:
+        session = parse_session_log(log_path)
+        out.append(f"  Project:  {session.project_name}")
+        out.append(f"  Messages: {len(session.messages)}")
+        out.append(f"  Date:     {session.date}")
+    finally:
+        _emit(out)
 
     conversation = get_conversation_text(session, config.max_conversation_chars)
+    return session, conversation
+
+
+def _extract(conversation: str, config):
+    """Run the LLM extraction for one conversation (safe to call from worker threads)."""
+    from .extractor import extract_with_claude
+
+    return extract_with_claude(
+        conversation,
+        model=config.extraction_model,
+        use_cache=config.extraction_cache_enabled,
+        cache_ttl_days=config.extraction_cache_ttl_days,
+        backend=config.extraction_backend,
+    )
 
-    print(f"  Extracting with Claude ({config.extraction_model})...")
-    extract = extract_with_claude(conversation, model=config.extraction_model)
 
-    # Inject git commits (deterministic, no LLM)
-    if session.project_path:
+def _finish_session(session, extract, config, dry_run: bool, out: list[str] | None = None):
+    """Inject git commits and write (or preview) one extracted session.
+
+    Output is collected into out (lines already queued by the caller go first)
+    and written in one go when the session is done.
+    """
+    from .git_helper import get_recent_commits
+    from .vault_writer import VaultWriter
+
+    out = [] if out is None else out
+    try:
+        # Inject git commits (deterministic, no LLM)
+        if session.project_path:
+            today = datetime.now().strftime("%Y-%m-%d")
+            commits = get_recent_commits(session.project_path, since_date=today)
+            if commits:
+                extract.commits = commits
+                out.append(f"  Commits:  {len(commits)} found")
+
+        if dry_run:
+            out.append("\n=== DRY RUN — would write: ===")
+            _print_extract(extract, out)
+            return
+
+        writer = VaultWriter(config)
         today = datetime.now().strftime("%Y-%m-%d")
-        commits = get_recent_commits(session.project_path, since_date=today)
-        if commits:
-            extract.commits = commits
-            print(f"  Commits:  {len(commits)} found")
-
-    if dry_run:
-        print("\n=== DRY RUN — would write: ===")
-        _print_extract(extract)
+        paths = writer.update(session.project_name, extract, date=today)
+        out.append(f"\n  STATUS:    {paths['status']}")
+        out.append(f"  Daily:     {paths['daily']}")
+        out.append(f"  DASHBOARD: {paths['dashboard']}")
+    finally:
+        _emit(out)
+
+
+def _log_stamp(log_path) -> list[int]:
+    """The [mtime_ns, size] of a session log, to tell whether it changed."""
+    st = log_path.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _read_processed() -> dict:
+    """Read the processed-sessions record. Returns {} if missing or unreadable."""
+    try:
+        data = json.loads(PROCESSED_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _mark_processed(log_path, stamp: list[int]):
+    """Record that log_path, as of stamp, has been written to the vault.
+
+    Entries for logs that no longer exist (Claude Code prunes old sessions)
+    are dropped, so the record doesn't outgrow the sessions on disk.
+    """
+    processed = {path: s for path, s in _read_processed().items() if os.path.exists(path)}
+    processed[str(log_path)] = stamp
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = PROCESSED_FILE.with_suffix(".json.tmp")
+    try:
+        tmp.write_text(json.dumps(processed), encoding="utf-8")
+        os.replace(tmp, PROCESSED_FILE)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def _is_up_to_date(log_path, config) -> bool:
+    """True if the vault already reflects this session log.
+
+    That is: this log was written to the vault before and has not changed
+    since (same mtime and size), and its project note (PROJECT.md or a legacy
+    STATUS.md) still exists. Costs a few stats and reading up to the first
+    message, instead of a full parse + LLM call.
+    """
+    from .parser import peek_project_path
+
+    if _read_processed().get(str(log_path)) != _log_stamp(log_path):
+        return False
+
+    project_path = peek_project_path(log_path)
+    project_dir = config.projects_path / (Path(project_path).name if project_path else "unknown")
+    return any((project_dir / name).exists() for name in ("PROJECT.md", "STATUS.md"))
+
+
+def _process_session(log_path, config, dry_run: bool, skip_existing: bool = False):
+    """Parse, extract, and write a single session."""
+    if skip_existing and _is_up_to_date(log_path, config):
+        print(f"Up to date, skipping: {log_path}")
+        return
+    # Stamp before parsing: anything appended from here on is picked up next run
+    stamp = _log_stamp(log_path)
+    session, conversation = _prepare_session(log_path, config)
+    print(f"  Extracting with Claude ({config.extraction_model})...")
+    extract = _extract(conversation, config)
+    _finish_session(session, extract, config, dry_run)
+    if not dry_run:
+        _mark_processed(log_path, stamp)
+
+
+def _process_sessions(recent, config, dry_run: bool, skip_existing: bool = False):
+    """Process several sessions, running their LLM extractions concurrently.
+
+    Extraction is network-bound and independent per session, so it runs on a
+    bounded thread pool. Parsing and vault writes stay on the main thread, in
+    order, so output reads sequentially and writes never race (every session
+    rewrites DASHBOARD.md).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    prepared = []
+    for name, log_path in recent:
+        try:
+            if skip_existing and _is_up_to_date(log_path, config):
+                print(f"Up to date, skipping: {log_path}")
+                continue
+            stamp = _log_stamp(log_path)
+            prepared.append((name, log_path, stamp, *_prepare_session(log_path, config)))
+        except Exception as e:
+            print(f"  Error processing {name}: {e}", file=sys.stderr)
+
+    if not prepared:
         return
 
-    writer = VaultWriter(config)
-    today = datetime.now().strftime("%Y-%m-%d")
-    paths = writer.update(session.project_name, extract, date=today)
-    print(f"\n  STATUS:    {paths['status']}")
-    print(f"  Daily:     {paths['daily']}")
-    print(f"  DASHBOARD: {paths['dashboard']}")
+    print(f"Extracting {len(prepared)} session(s) with Claude ({config.extraction_model})...")
+    workers = max(1, min(config.extraction_concurrency, len(prepared)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            (name, log_path, stamp, session, pool.submit(_extract, conversation, config))
+            for name, log_path, stamp, session, conversation in prepared
+        ]
+        for name, log_path, stamp, session, future in futures:
+            out = [f"\n{session.project_name}:"]
+            try:
+                extract = future.result()
+            except Exception as e:
+                _emit(out)
+                print(f"  Error processing {name}: {e}", file=sys.stderr)
+                continue
+            try:
+                _finish_session(session, extract, config, dry_run, out=out)
+            except Exception as e:
+                print(f"  Error processing {name}: {e}", file=sys.stderr)
+                continue
+            if not dry_run:
+                _mark_processed(log_path, stamp)
 
 
 def _read_last_run() -> float:
@@ -442,6 +594,7 @@ def main(argv: list[str] | None = None):
         return
 
     config = load_config()
+    from .vault_writer import VaultWriter
 
     # --daily-rollup: generate cross-project daily rollup
     if args.daily_rollup is not None:
@@ -485,6 +638,13 @@ def main(argv: list[str] | None = None):
 
         return
 
+    from .session_finder import (
+        get_current_session_log,
+        get_session_log_by_id,
+        get_session_log_by_project,
+        list_recent_projects,
+    )
+
     # --all-projects: update every recent project
     if args.all_projects:
         since = _read_last_run() if args.since_last_run else 0.0
@@ -496,11 +656,7 @@ def main(argv: list[str] | None = None):
                 return
             print("No recent projects found.")
             return
-        for name, log_path in recent:
-            try:
-                _process_session(log_path, config, args.dry_run)
-            except Exception as e:
-                print(f"  Error processing {name}: {e}", file=sys.stderr)
+        _process_sessions(recent, config, args.dry_run, args.skip_existing)
 
         if args.since_last_run:
             _write_last_run()
@@ -518,7 +674,7 @@ def main(argv: list[str] | None = None):
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    _process_session(log_path, config, args.dry_run)
+    _process_session(log_path, config, args.dry_run, args.skip_existing)
 
 
 if __name__ == "__main__":
@@ -2,6 +2,8 @@
 
 Precedence: TOML config > env vars > platform defaults.
 """
+import copy
+import functools
 import os
 import platform
 import sys
@@ -29,6 +31,10 @@ class Config:
     projects_folder: str  # subfolder name inside vault (default: "Projects")
     extraction_model: str  # claude model for extraction (default: "haiku")
     max_conversation_chars: int  # truncation limit (default: 50000)
+    extraction_cache_enabled: bool = True  # reuse responses for unchanged sessions
+    extraction_cache_ttl_days: int = 30  # 0 = never expire
+    extraction_backend: str = "cli"  # "cli" (claude command) | "api" (Anthropic SDK)
+    extraction_concurrency: int = 4  # parallel extractions for --all-projects
 
     @property
     def projects_path(self) -> Path:
@@ -36,8 +42,9 @@ class Config:
         return self.vault_path / self.projects_folder
 
 
+@functools.cache
 def _platform_default_vault() -> Path:
-    """Return platform-specific default vault path."""
+    """Return platform-specific default vault path (computed once per process)."""
     system = platform.system()
     if system == "Darwin":
         return Path.home() / "Library" / "Mobile Documents" / "iCloud~md~obsidian" / "Documents" / "MyVault"
@@ -49,10 +56,21 @@ def _platform_default_vault() -> Path:
 
 
 def _load_toml() -> dict:
-    """Load TOML config file if it exists."""
-    if not CONFIG_FILE.exists():
+    """Load TOML config file if it exists.
+
+    The parse is cached on the file's (mtime, size), so repeated loads in one
+    process cost a stat until the file is edited.
+    """
+    try:
+        st = CONFIG_FILE.stat()
+    except FileNotFoundError:
         return {}
-    with open(CONFIG_FILE, "rb") as f:
+    return copy.deepcopy(_parse_toml(str(CONFIG_FILE), st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_toml(path: str, mtime_ns: int, size: int) -> dict:
+    with open(path, "rb") as f:
         return tomllib.load(f)
 
 
@@ -85,6 +103,10 @@ def load_config() -> Config:
     # Extraction settings
     extraction_model = extraction_section.get("model", "haiku")
     max_chars = extraction_section.get("max_conversation_chars", 50000)
+    cache_enabled = extraction_section.get("cache", True)
+    cache_ttl_days = extraction_section.get("cache_ttl_days", 30)
+    backend = extraction_section.get("backend", "cli")
+    concurrency = extraction_section.get("concurrency", 4)
 
     return Config(
         vault_path=vault_path,
@@ -92,6 +114,10 @@ def load_config() -> Config:
         projects_folder=projects_folder,
         extraction_model=extraction_model,
         max_conversation_chars=max_chars,
+        extraction_cache_enabled=cache_enabled,
+        extraction_cache_ttl_days=cache_ttl_days,
+        extraction_backend=backend,
+        extraction_concurrency=concurrency,
     )
 
 
@@ -2,20 +2,36 @@
 
 v2: Focuses on project state and deliverables, not file lists.
 """
+import importlib.util
 import json
 import re
 import subprocess
 from dataclasses import dataclass, field
 
+from . import extractor_cache
 
-@dataclass
+# The SDK is slow to import and only needed for backend = "api", so it is
+# imported in _run_api; only its presence is checked here.
+HAS_ANTHROPIC = importlib.util.find_spec("anthropic") is not None
+
+try:
+    import orjson
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the handlers
+    # below work with either parser
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads  # type: ignore[assignment]
+
+
+@dataclass(slots=True)
 class CompletedGroup:
     """A group of related completed items under a heading."""
     heading: str
     items: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class IssueRef:
     """A GitHub issue reference with metadata."""
     number: str
@@ -24,14 +40,14 @@ class IssueRef:
     status: str = "Pending"
 
 
-@dataclass
+@dataclass(slots=True)
 class CommitRef:
     """A git commit reference."""
     hash: str
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionExtract:
     """Extracted project state from a coding session."""
     status: str  # One-line current state
@@ -54,47 +70,32 @@ class SessionExtract:
     category: str = "work"  # work | personal
 
 
+# One match per [CAPTURE] block: the tagged line plus every continuation line
+# up to the next speaker line, or a blank line that ends the paragraph (one
+# followed by a speaker/tool line, or the end of the text).
+_CAPTURE_RE = re.compile(
+    r"^(?:User|Assistant): \[CAPTURE\]"
+    r"(.*(?:\n(?!User:|Assistant:|A:)(?![^\S\n]*(?:\n(?:User:|Assistant:|A:|\[)|\Z)).*)*)",
+    re.MULTILINE,
+)
+
+
 def extract_captures(conversation_text: str) -> list[str]:
     """Extract [CAPTURE] tagged content from conversation."""
-    captures = []
-
-    lines = conversation_text.split("\n")
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        is_user_capture = line.startswith("User: [CAPTURE]")
-        is_assistant_capture = line.startswith("Assistant: [CAPTURE]")
-
-        if is_user_capture or is_assistant_capture:
-            if is_user_capture:
-                content = line[len("User: [CAPTURE]"):].strip()
-            else:
-                content = line[len("Assistant: [CAPTURE]"):].strip()
-
-            # Collect multiline content until next speaker or empty line
-            i += 1
-            while i < len(lines):
-                next_line = lines[i]
-                if next_line.startswith("User:") or next_line.startswith("Assistant:"):
-                    break
-                if next_line.startswith("A:"):
-                    break
-                if not next_line.strip():
-                    if i + 1 >= len(lines) or lines[i + 1].startswith(("User:", "Assistant:", "A:", "[")):
-                        break
-                content += "\n" + next_line
-                i += 1
-
-            content = content.strip()
-            if content and len(content) > 10:
-                captures.append(content)
-        else:
-            i += 1
-
+    captures: list[str] = []
+    if "[CAPTURE]" not in conversation_text:
+        return captures
+    for m in _CAPTURE_RE.finditer(conversation_text):
+        first, sep, rest = m.group(1).partition("\n")
+        content = (first.strip() + sep + rest).strip()
+        if content and len(content) > 10:
+            captures.append(content)
     return captures
 
 
+# Bump when the prompt or the response schema changes; part of the cache key
+EXTRACTION_PROMPT_VERSION = "v2"
+
 EXTRACTION_PROMPT = '''You are a JSON extraction bot. Output ONLY valid JSON. No explanations. No markdown. No conversation.
 
 Extract the current PROJECT STATE from the coding session below. Focus on deliverables and status, not file paths.
@@ -120,28 +121,48 @@ CRITICAL: Output ONLY the JSON object. Start with { and end with }
 ---SESSION START---
 '''
 
+_PROMPT_SUFFIX = "\n---SESSION END---\n\nJSON output:"
+
+# The static half of every cache key, hashed once rather than on each call
+_PROMPT_DIGEST = extractor_cache.cache_key(EXTRACTION_PROMPT_VERSION, EXTRACTION_PROMPT)
+
+
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
 
 def strip_markdown_code_blocks(text: str) -> str:
     """Remove markdown code block wrappers from text."""
-    pattern = r"```(?:json)?\s*([\s\S]*?)\s*```"
-    match = re.search(pattern, text)
+    match = _FENCE_RE.search(text)
     if match:
         return match.group(1).strip()
     return text
 
 
-def _parse_json_response(raw: str) -> dict:
+def _parse_json_response(raw: bytes | str) -> dict:
     """Parse JSON from Claude CLI output, handling various response formats."""
-    # Try direct parse first
+    # Common case: `claude -p --output-format json` always wraps the reply in
+    # a {"result": ...} envelope, so one parse of the raw bytes gets there
     try:
-        response = json.loads(raw)
-        content = response.get("result", raw)
-    except json.JSONDecodeError:
-        content = raw
-
-    if isinstance(content, dict):
-        return content
-
+        envelope = _json_loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        envelope = None
+
+    if isinstance(envelope, dict) and "result" in envelope:
+        result = envelope["result"]
+        if isinstance(result, dict):
+            return result
+        if not isinstance(result, str):
+            raise ValueError(f"Unexpected result type in Claude CLI output: {type(result).__name__}")
+        return _extract_json_object(result)
+
+    # No envelope: treat the whole output as model text
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8", "replace")
+    return _extract_json_object(raw)
+
+
+def _extract_json_object(content: str) -> dict:
+    """Parse the JSON object out of model text, tolerating code fences or chatter."""
     # Strip markdown code blocks
     content = strip_markdown_code_blocks(content)
 
@@ -149,26 +170,99 @@ def _parse_json_response(raw: str) -> dict:
     start = content.find("{")
     end = content.rfind("}") + 1
     if start >= 0 and end > start:
-        return json.loads(content[start:end])
+        return _json_loads(content[start:end])
 
     raise ValueError(f"Could not parse JSON from response: {content[:500]}")
 
 
-def extract_with_claude(conversation_text: str, model: str = "haiku") -> SessionExtract:
-    """Use Claude CLI to extract project state from conversation."""
-    prompt = EXTRACTION_PROMPT + conversation_text + "\n---SESSION END---\n\nJSON output:"
+def _run_claude(conversation_text: str, model: str) -> dict:
+    """Run the Claude CLI extraction and return the parsed JSON object."""
+    prompt = f"{EXTRACTION_PROMPT}{conversation_text}{_PROMPT_SUFFIX}"
 
+    # The prompt goes in on stdin (`claude -p` reads it there when no prompt
+    # argument is given): one pipe write instead of a copy into argv, where
+    # Linux also caps a single argument at MAX_ARG_STRLEN (128 KiB).
     result = subprocess.run(
-        ["claude", "-p", prompt, "--output-format", "json", "--model", model],
+        ["claude", "-p", "--output-format", "json", "--model", model],
+        input=prompt.encode("utf-8"),
         capture_output=True,
-        text=True,
         timeout=120,
     )
 
     if result.returncode != 0:
-        raise RuntimeError(f"Claude CLI failed: {result.stderr}")
+        raise RuntimeError(f"Claude CLI failed: {result.stderr.decode('utf-8', 'replace')}")
+
+    return _parse_json_response(result.stdout)
+
+
+# CLI-style aliases accepted in config; anything else is passed to the API as-is
+API_MODEL_ALIASES = {
+    "haiku": "claude-haiku-4-5",
+    "sonnet": "claude-sonnet-4-5",
+    "opus": "claude-opus-4-1",
+}
 
-    data = _parse_json_response(result.stdout)
+
+def _run_api(conversation_text: str, model: str) -> dict:
+    """Run the extraction through the Anthropic Messages API.
+
+    The static EXTRACTION_PROMPT is the system prompt and only the
+    conversation varies per call. It is not marked for prompt caching: the
+    prompt is shorter than the API's minimum cacheable prefix, so a
+    cache_control marker would have no effect.
+    """
+    if not HAS_ANTHROPIC:
+        raise RuntimeError("backend = \"api\" requires the anthropic package: pip install anthropic")
+
+    import anthropic
+
+    client = anthropic.Anthropic()
+    try:
+        message = client.messages.create(
+            model=API_MODEL_ALIASES.get(model, model),
+            max_tokens=4096,
+            system=EXTRACTION_PROMPT,
+            # Two text blocks rather than one concatenated copy of the
+            # conversation; the model sees the same text either way
+            messages=[{
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": conversation_text},
+                    {"type": "text", "text": _PROMPT_SUFFIX},
+                ],
+            }],
+            timeout=120,
+        )
+    except anthropic.APIError as e:
+        raise RuntimeError(f"Claude API failed: {e}") from e
+
+    text = "".join(block.text for block in message.content if block.type == "text")
+    return _extract_json_object(text)
+
+
+def extract_with_claude(
+    conversation_text: str,
+    model: str = "haiku",
+    use_cache: bool = True,
+    cache_ttl_days: int = 30,
+    backend: str = "cli",
+) -> SessionExtract:
+    """Use Claude to extract project state from conversation.
+
+    backend is "cli" (the `claude` command) or "api" (the Anthropic SDK).
+    Responses are cached on disk by (backend, model, prompt version, prompt,
+    conversation) hash, so an unchanged session is never sent to Claude twice.
+    """
+    backend = "api" if backend == "api" else "cli"
+    run = _run_api if backend == "api" else _run_claude
+    if use_cache:
+        key = extractor_cache.cache_key(backend, model, _PROMPT_DIGEST, conversation_text)
+        data = extractor_cache.get(key, cache_ttl_days)
+        if data is None:
+            data = run(conversation_text, model)
+            extractor_cache.put(key, data)
+    else:
+        data = run(conversation_text, model)
 
     # Extract [CAPTURE] tags directly (no LLM needed)
     knowledge = extract_captures(conversation_text)
@@ -0,0 +1,64 @@
+"""On-disk cache of Claude extraction responses.
+
+Entries are keyed by a SHA-256 over everything that determines the LLM
+output (model, prompt, conversation), so re-running over unchanged sessions
+skips the `claude` subprocess entirely.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+CACHE_DIR = Path.home() / ".cache" / "obsidian-agent" / "extract"
+
+
+def cache_key(*parts: str) -> str:
+    """Hash the given strings into a hex cache key.
+
+    Each part is length-prefixed so ("ab", "c") and ("a", "bc") differ.
+    """
+    h = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8")
+        h.update(len(data).to_bytes(8, "little"))
+        h.update(data)
+    return h.hexdigest()
+
+
+def get(key: str, ttl_days: int = 0) -> dict | None:
+    """Return the cached response for key, or None if missing or expired.
+
+    ttl_days <= 0 means entries never expire. An expired entry is deleted,
+    so the cache doesn't keep every response ever made.
+    """
+    path = CACHE_DIR / f"{key}.json"
+    try:
+        if ttl_days > 0 and time.time() - path.stat().st_mtime > ttl_days * 86400:
+            path.unlink(missing_ok=True)
+            return None
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def put(key: str, data: dict):
+    """Store a parsed response under key.
+
+    Best effort: a failed write (read-only or full disk) leaves the entry
+    uncached rather than losing the response the caller already has.
+    """
+    path = CACHE_DIR / f"{key}.json"
+    # Atomic write: write to temp then replace
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(data))
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
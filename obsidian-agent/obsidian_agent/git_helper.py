@@ -1,9 +1,39 @@
 """Extract git commits for a project (deterministic, no LLM needed)."""
+import heapq
+import os
 import subprocess
+from datetime import date, datetime, time
 from pathlib import Path
 
 from .extractor import CommitRef
 
+try:
+    import pygit2
+    HAS_PYGIT2 = True
+except ImportError:
+    HAS_PYGIT2 = False
+
+# Upper bound on commits read per call; a day's log never gets near this
+MAX_COMMITS = 200
+
+# Paths already found not to be inside a git repository (per process)
+_NON_REPOS: set[str] = set()
+
+
+def _in_git_repo(path: Path) -> bool:
+    """Cheap stat-only check that git would find a repository from path.
+
+    Looks for .git (directory, or file for worktrees/submodules) in path and
+    its parents, the way git discovers a repo, so sessions started in a
+    subdirectory still count. Saves forking git just to hear "not a git
+    repository".
+    """
+    if os.environ.get("GIT_DIR"):
+        return True  # git won't search; let it decide
+    if not path.exists():
+        return False
+    return any((p / ".git").exists() for p in (path, *path.parents))
+
 
 def get_recent_commits(project_path: str, since_date: str = "") -> list[CommitRef]:
     """Get git commits for a project since a given date.
@@ -15,10 +45,26 @@ def get_recent_commits(project_path: str, since_date: str = "") -> list[CommitRe
     Returns:
         List of CommitRef with short hash and message.
     """
-    if not Path(project_path).exists():
+    if project_path in _NON_REPOS:
+        return []
+    if not _in_git_repo(Path(project_path)):
+        _NON_REPOS.add(project_path)
         return []
 
-    cmd = ["git", "-C", project_path, "log", "--oneline", "--no-decorate"]
+    if HAS_PYGIT2:
+        try:
+            since_ts = _since_timestamp(since_date)
+        except ValueError:
+            pass  # not YYYY-MM-DD; let git's date parser have it
+        else:
+            return _commits_pygit2(project_path, since_ts)
+
+    # NUL between commits, US (0x1f) between hash and subject: no line
+    # splitting, and subjects with odd whitespace can't shift the fields
+    cmd = [
+        "git", "-C", project_path, "log", "-z", "--no-decorate",
+        f"--max-count={MAX_COMMITS}", "--format=%h%x1f%s",
+    ]
     if since_date:
         cmd.extend(["--since", since_date])
     else:
@@ -28,7 +74,6 @@ def get_recent_commits(project_path: str, since_date: str = "") -> list[CommitRe
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=10,
         )
         if result.returncode != 0:
@@ -37,14 +82,55 @@ def get_recent_commits(project_path: str, since_date: str = "") -> list[CommitRe
         return []
 
     commits = []
-    for line in result.stdout.strip().splitlines():
-        if not line:
-            continue
-        # Format: "abc1234 commit message here"
-        parts = line.split(" ", 1)
-        if len(parts) == 2:
-            commits.append(CommitRef(hash=parts[0], message=parts[1]))
-        elif len(parts) == 1:
-            commits.append(CommitRef(hash=parts[0], message=""))
+    for record in result.stdout.decode("utf-8", "replace").split("\0"):
+        commit_hash, _, message = record.strip("\n").partition("\x1f")
+        if commit_hash:
+            commits.append(CommitRef(hash=commit_hash, message=message))
+    return commits
 
+
+def _since_timestamp(since_date: str) -> float:
+    """Turn since_date into the cutoff `git log --since` would use.
+
+    git reads a bare YYYY-MM-DD as that day at the current time of day, and
+    "midnight" as the start of today; mirror both so either path agrees.
+    """
+    now = datetime.now()
+    if since_date:
+        return datetime.combine(date.fromisoformat(since_date), now.time()).timestamp()
+    return datetime.combine(now.date(), time.min).timestamp()
+
+
+def _commits_pygit2(project_path: str, since_ts: float) -> list[CommitRef]:
+    """Walk commits in-process with libgit2: no git fork or pipe per project."""
+    repo_path = pygit2.discover_repository(project_path)
+    if repo_path is None:
+        return []
+    try:
+        repo = pygit2.Repository(repo_path)
+        head = repo.head.target
+    except (pygit2.GitError, KeyError):
+        return []  # unborn HEAD or unreadable repository
+
+    # git log's own walk: newest commit first, ties in the order they were
+    # reached (child before parent), and never expanding past a commit older
+    # than the cutoff. libgit2's time sort leaves same-second commits (e.g.
+    # a rebase) in arbitrary order, so the queue is kept here instead.
+    commits = []
+    seen = {head}
+    queue = [(-repo[head].commit_time, 0, repo[head])]
+    order = 1
+    while queue and len(commits) < MAX_COMMITS:
+        _, _, commit = heapq.heappop(queue)
+        if commit.commit_time < since_ts:
+            continue
+        # %s: the first paragraph of the message, its lines joined by spaces
+        paragraph = commit.message.strip().split("\n\n", 1)[0]
+        subject = " ".join(line.strip() for line in paragraph.splitlines())
+        commits.append(CommitRef(hash=commit.short_id, message=subject))
+        for parent in commit.parents:
+            if parent.id not in seen:
+                seen.add(parent.id)
+                heapq.heappush(queue, (-parent.commit_time, order, parent))
+                order += 1
     return commits
@@ -1,11 +1,27 @@
 """Parse Claude Code conversation logs (.jsonl)."""
 import json
-from dataclasses import dataclass
+import mmap
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
 
-@dataclass
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the handlers
+    # below work with either parser
+    _json_loads = orjson.loads
+    HAS_ORJSON = True
+except ImportError:
+    _json_loads = json.loads  # type: ignore[assignment]
+    HAS_ORJSON = False
+
+TOOL_INPUT_PREVIEW_CHARS = 500
+
+
+@dataclass(slots=True)
 class ConversationMessage:
     """A single message in the conversation."""
     role: str  # 'user' or 'assistant'
@@ -13,9 +29,11 @@ class ConversationMessage:
     timestamp: str
     tool_name: Optional[str] = None
     tool_input: Optional[dict] = None
+    # Rendered tool_input, filled in on first use by _preview()
+    _tool_input_preview: str | None = field(default=None, init=False, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionInfo:
     """Information about a Claude Code session."""
     session_id: str
@@ -31,12 +49,9 @@ class SessionInfo:
         Timestamps look like: '2026-02-06T14:23:45.123Z'
         Falls back to empty string if no messages or unparseable.
         """
-        if not self.messages:
-            return ""
-        ts = self.messages[0].timestamp
-        if not ts:
-            return ""
-        # ISO timestamps start with YYYY-MM-DD
+        ts = self.messages[0].timestamp if self.messages else ""
+        # ISO timestamps start with YYYY-MM-DD; the length check also
+        # covers missing timestamps
         return ts[:10] if len(ts) >= 10 else ""
 
 
@@ -45,7 +60,9 @@ def extract_content(message_data: dict) -> tuple[str, Optional[str], Optional[di
     msg = message_data.get("message", {})
     content_parts = msg.get("content", [])
 
-    if isinstance(content_parts, str):
+    # Parsed JSON only ever produces exact dict/str, so exact type checks
+    # are safe and skip isinstance's subclass walk on every block
+    if type(content_parts) is str:
         return content_parts, None, None
 
     text_parts = []
@@ -53,18 +70,42 @@ def extract_content(message_data: dict) -> tuple[str, Optional[str], Optional[di
     tool_input = None
 
     for part in content_parts:
-        if isinstance(part, dict):
-            if part.get("type") == "text":
+        part_type = type(part)
+        if part_type is dict:
+            kind = part.get("type")
+            if kind == "text":
                 text_parts.append(part.get("text", ""))
-            elif part.get("type") == "tool_use":
+            elif kind == "tool_use":
                 tool_name = part.get("name")
                 tool_input = part.get("input")
-        elif isinstance(part, str):
+        elif part_type is str:
             text_parts.append(part)
 
     return "\n".join(text_parts), tool_name, tool_input
 
 
+def _iter_entries(log_path: Path) -> Iterator[dict]:
+    """Yield the user/assistant candidate entries of a .jsonl log.
+
+    The file is mmapped and split with mmap.readline (a C memchr per line),
+    so each line goes to the JSON parser as bytes with no text-mode decode
+    or strip() copy. Every message entry has "type": "user"/"assistant", so
+    lines with neither token (summaries, snapshots, blanks) are dropped
+    before paying for the parse. Malformed lines are skipped.
+    """
+    with open(log_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # mmap refuses empty files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                if b'"user"' not in line and b'"assistant"' not in line:
+                    continue
+                try:
+                    yield _json_loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+
+
 def parse_session_log(log_path: Path) -> SessionInfo:
     """Parse a Claude Code session log file."""
     messages = []
@@ -72,45 +113,35 @@ def parse_session_log(log_path: Path) -> SessionInfo:
     project_path = ""
     git_branch = ""
 
-    with open(log_path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-
-            try:
-                data = json.loads(line)
-            except json.JSONDecodeError:
-                continue
+    for data in _iter_entries(log_path):
+        msg_type = data.get("type")
 
-            msg_type = data.get("type")
+        # Skip non-message entries
+        if msg_type not in ("user", "assistant"):
+            continue
 
-            # Skip non-message entries
-            if msg_type not in ("user", "assistant"):
-                continue
+        # Extract session info from first message
+        if not session_id:
+            session_id = data.get("sessionId", "")
+            project_path = data.get("cwd", "")
+            git_branch = data.get("gitBranch", "")
 
-            # Extract session info from first message
-            if not session_id:
-                session_id = data.get("sessionId", "")
-                project_path = data.get("cwd", "")
-                git_branch = data.get("gitBranch", "")
+        content, tool_name, tool_input = extract_content(data)
 
-            content, tool_name, tool_input = extract_content(data)
+        # Skip empty messages and thinking blocks
+        if not content and not tool_name:
+            continue
 
-            # Skip empty messages and thinking blocks
-            if not content and not tool_name:
-                continue
+        role = data.get("message", {}).get("role", msg_type)
+        timestamp = data.get("timestamp", "")
 
-            role = data.get("message", {}).get("role", msg_type)
-            timestamp = data.get("timestamp", "")
-
-            messages.append(ConversationMessage(
-                role=role,
-                content=content,
-                timestamp=timestamp,
-                tool_name=tool_name,
-                tool_input=tool_input,
-            ))
+        messages.append(ConversationMessage(
+            role=role,
+            content=content,
+            timestamp=timestamp,
+            tool_name=tool_name,
+            tool_input=tool_input,
+        ))
 
     # Extract project name from path
     project_name = Path(project_path).name if project_path else "unknown"
@@ -124,28 +155,76 @@ def parse_session_log(log_path: Path) -> SessionInfo:
     )
 
 
-def get_conversation_text(session: SessionInfo, max_chars: int = 50000) -> str:
-    """Get conversation as readable text for analysis."""
+def peek_project_path(log_path: Path) -> str:
+    """Return the session's cwd without parsing the whole log.
+
+    Same source as parse_session_log: the cwd of the first user/assistant
+    entry that has a session ID (in practice, the first one), else of the
+    last such entry. Empty string if there is none.
+    """
+    cwd = ""
+    for data in _iter_entries(log_path):
+        if data.get("type") in ("user", "assistant"):
+            cwd = data.get("cwd", "")
+            if data.get("sessionId", ""):
+                break
+    return cwd
+
+
+def _dump_indented(obj) -> str:
+    """JSON-dump obj with 2-space indent, via orjson's C encoder when available."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:  # orjson.JSONEncodeError, e.g. ints beyond 64 bits
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _preview(msg: ConversationMessage) -> str:
+    """Truncated, memoized JSON rendering of the message's tool_input."""
+    if msg._tool_input_preview is None:
+        input_str = _dump_indented(msg.tool_input)
+        if len(input_str) > TOOL_INPUT_PREVIEW_CHARS:
+            input_str = input_str[:TOOL_INPUT_PREVIEW_CHARS] + "..."
+        msg._tool_input_preview = input_str
+    return msg._tool_input_preview
+
+
+def _format_message(msg: ConversationMessage) -> str:
+    """Render one message as its block of conversation text."""
+    role = "User" if msg.role == "user" else "Assistant"
     lines = []
 
-    for msg in session.messages:
-        role = "User" if msg.role == "user" else "Assistant"
+    if msg.tool_name:
+        lines.append(f"[{role} used tool: {msg.tool_name}]")
+        if msg.tool_input:
+            # Summarize tool input
+            lines.append(f"  Input: {_preview(msg)}")
 
-        if msg.tool_name:
-            lines.append(f"[{role} used tool: {msg.tool_name}]")
-            if msg.tool_input:
-                # Summarize tool input
-                input_str = json.dumps(msg.tool_input, indent=2)
-                if len(input_str) > 500:
-                    input_str = input_str[:500] + "..."
-                lines.append(f"  Input: {input_str}")
+    if msg.content:
+        lines.append(f"{role}: {msg.content}")
 
-        if msg.content:
-            lines.append(f"{role}: {msg.content}")
+    lines.append("")
+    return "\n".join(lines)
 
-        lines.append("")
 
-    text = "\n".join(lines)
+def get_conversation_text(session: SessionInfo, max_chars: int = 50000) -> str:
+    """Get conversation as readable text for analysis."""
+    # Only the tail survives truncation, so render messages newest-first and
+    # stop once there is more than max_chars of text; older messages are
+    # never formatted (or their tool inputs JSON-dumped) at all.
+    blocks = []
+    size = -1  # no separator before the first block
+    for msg in reversed(session.messages):
+        block = _format_message(msg)
+        blocks.append(block)
+        size += len(block) + 1
+        if size > max_chars > 0:
+            break
+    blocks.reverse()
+
+    text = "\n".join(blocks)
 
     # Truncate if too long (keep end, which has most recent context)
     if len(text) > max_chars:
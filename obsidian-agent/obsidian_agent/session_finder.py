@@ -2,7 +2,9 @@
 
 Bug fix from v1: Always uses filesystem mtime — never trusts sessions-index.json.
 """
+import heapq
 import os
+from operator import itemgetter
 from pathlib import Path
 
 from .config import Config
@@ -19,10 +21,14 @@ def _project_folder(claude_projects_path: Path, cwd: str) -> Path:
     if candidate.exists():
         return candidate
 
-    # Try with leading dash stripped then re-added (edge cases)
-    alt = claude_projects_path / ("-" + cwd.replace("/", "-").lstrip("-"))
-    if alt.exists():
-        return alt
+    # Try with leading dashes collapsed to one (edge cases like "//x").
+    # For any ordinary absolute path this is the same name, so only stat
+    # it when it differs.
+    alt_name = "-" + folder_name.lstrip("-")
+    if alt_name != folder_name:
+        alt = claude_projects_path / alt_name
+        if alt.exists():
+            return alt
 
     raise FileNotFoundError(
         f"No Claude project folder found for {cwd}\n"
@@ -30,12 +36,34 @@ def _project_folder(claude_projects_path: Path, cwd: str) -> Path:
     )
 
 
+def _latest_jsonl(folder: str | Path) -> tuple[str | None, float]:
+    """Return (path, mtime) of the newest .jsonl file in folder, or (None, 0.0).
+
+    One scandir pass: no Path object per file, and each file is stat'ed
+    once (DirEntry caches the result) instead of once by max() and again
+    by the caller. Ties go to the first entry listed, as with max().
+    """
+    best_path = None
+    best_mtime = 0.0
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".jsonl") or not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime
+                if best_path is None or mtime > best_mtime:
+                    best_path, best_mtime = entry.path, mtime
+    except (FileNotFoundError, NotADirectoryError):
+        pass  # glob() treated these as empty too
+    return best_path, best_mtime
+
+
 def _most_recent_jsonl(folder: Path) -> Path:
     """Return the most recently modified .jsonl file in folder."""
-    jsonl_files = list(folder.glob("*.jsonl"))
-    if not jsonl_files:
+    latest, _ = _latest_jsonl(folder)
+    if latest is None:
         raise FileNotFoundError(f"No session logs found in {folder}")
-    return max(jsonl_files, key=lambda p: p.stat().st_mtime)
+    return Path(latest)
 
 
 def get_current_session_log(config: Config) -> Path:
@@ -62,6 +90,19 @@ def get_session_log_by_project(config: Config, project_path: str) -> Path:
     return _most_recent_jsonl(folder)
 
 
+def _project_name(folder_name: str) -> str:
+    """Decode a Claude project folder name back to the project's name."""
+    # e.g., -home-jjob-projects-VE-RAG-System → VE-RAG-System
+    if not folder_name.startswith("-"):
+        return folder_name.rpartition("-")[2]
+    # Encoded absolute path: the name is its last non-empty component. A
+    # lone "." component is left to pathlib, which drops it.
+    name = folder_name.rstrip("-").rpartition("-")[2]
+    if name == ".":
+        return Path(folder_name.replace("-", "/")).name
+    return name
+
+
 def list_recent_projects(
     config: Config, limit: int = 10, since_timestamp: float = 0.0
 ) -> list[tuple[str, Path]]:
@@ -75,28 +116,25 @@ def list_recent_projects(
 
     Returns list of (project_name, most_recent_log_path) tuples.
     """
-    projects: list[tuple[str, Path, float]] = []
-    for folder in config.claude_projects_path.iterdir():
-        if not folder.is_dir():
-            continue
-        jsonl_files = list(folder.glob("*.jsonl"))
-        if not jsonl_files:
-            continue
-        latest = max(jsonl_files, key=lambda p: p.stat().st_mtime)
-        mtime = latest.stat().st_mtime
-
-        # Skip if older than threshold
-        if since_timestamp and mtime < since_timestamp:
-            continue
-
-        # Decode folder name back to project name
-        # e.g., -home-jjob-projects-VE-RAG-System → VE-RAG-System
-        name = folder.name.rsplit("-", 1)[-1] if "-" in folder.name else folder.name
-        # Better: take last path component from decoded path
-        decoded = folder.name.replace("-", "/")
-        if decoded.startswith("/"):
-            name = Path(decoded).name
-        projects.append((name, latest, mtime))
-
-    projects.sort(key=lambda t: t[2], reverse=True)
-    return [(name, path) for name, path, _ in projects[:limit]]
+    # DirEntry.is_dir() answers from the directory listing (d_type) instead
+    # of a stat() per folder; names and paths stay plain strings until the
+    # survivors are picked.
+    projects: list[tuple[str, str, float]] = []
+    with os.scandir(config.claude_projects_path) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            latest, mtime = _latest_jsonl(entry.path)
+            if latest is None:
+                continue
+
+            # Skip if older than threshold
+            if since_timestamp and mtime < since_timestamp:
+                continue
+
+            projects.append((entry.name, latest, mtime))
+
+    # Only the top `limit` are kept: O(N log limit) rather than a full sort.
+    # nlargest is stable, so mtime ties keep directory order as sort() did.
+    top = heapq.nlargest(limit, projects, key=itemgetter(2))
+    return [(_project_name(folder_name), Path(latest)) for folder_name, latest, _ in top]
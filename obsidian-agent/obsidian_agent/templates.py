@@ -1,5 +1,11 @@
 """Markdown templates for vault files."""
+import string
 from datetime import datetime
+from time import monotonic
+
+# How long a formatted "now" is reused across render calls
+_NOW_TTL_SECONDS = 1.0
+_now_cache: dict[str, tuple[float, str]] = {}
 
 # ---------------------------------------------------------------------------
 # PROJECT.md — hub/identity document (slow-changing, no temporal content)
@@ -214,18 +220,76 @@ ROLLUP_PROJECT_SECTION = """\
 """
 
 
+def _compile_template(template: str):
+    """Turn a str.format template into a function with the template baked in.
+
+    str.format re-parses its template on every call. Compiling the template
+    as the body of an f-string does that parse once, at import, leaving a
+    single BUILD_STRING per render. Only plain {name} fields are supported;
+    like str.format, extra keyword arguments are accepted and ignored.
+    """
+    fields: list[str] = []
+    for _, name, spec, conversion in string.Formatter().parse(template):
+        if name is None:
+            continue
+        if not name.isidentifier() or spec or conversion:
+            raise ValueError(f"Unsupported template field: {{{name}}}")
+        if name not in fields:
+            fields.append(name)
+    params = f"*, {', '.join(fields)}, **_" if fields else "**_"
+    namespace: dict = {}
+    # Only ever fed this module's own template constants
+    exec(f"def render({params}):\n    return f{template!r}\n", namespace)  # noqa: S102
+    return namespace["render"]
+
+
+_fill_project = _compile_template(PROJECT_TEMPLATE)
+_fill_dashboard = _compile_template(DASHBOARD_TEMPLATE)
+_fill_daily_entry = _compile_template(DAILY_ENTRY_TEMPLATE)
+_fill_daily_header = _compile_template(DAILY_HEADER_TEMPLATE)
+_fill_daily_rollup = _compile_template(DAILY_ROLLUP_TEMPLATE)
+_fill_daily_rollup_project = _compile_template(DAILY_ROLLUP_PROJECT_SECTION)
+_fill_weekly = _compile_template(WEEKLY_TEMPLATE)
+_fill_weekly_multi = _compile_template(WEEKLY_MULTI_PROJECT_TEMPLATE)
+_fill_monthly = _compile_template(MONTHLY_TEMPLATE)
+_fill_monthly_multi = _compile_template(MONTHLY_MULTI_PROJECT_TEMPLATE)
+_fill_rollup_project_section = _compile_template(ROLLUP_PROJECT_SECTION)
+
+
+def _now(fmt: str = "%Y-%m-%d %H:%M") -> str:
+    """datetime.now().strftime(fmt), reused for up to _NOW_TTL_SECONDS.
+
+    A batch of renders (every rollup section, dashboard, daily entry of a
+    run) asks for the current time over and over; this formats it once.
+    """
+    t = monotonic()
+    hit = _now_cache.get(fmt)
+    if hit is not None and t - hit[0] < _NOW_TTL_SECONDS:
+        return hit[1]
+    value = datetime.now().strftime(fmt)
+    _now_cache[fmt] = (t, value)
+    return value
+
+
 def _bullet_list(items: list[str], empty: str = "_None_") -> str:
     """Format a list as markdown bullets. Returns empty marker if no items."""
     if not items:
         return empty
-    return "\n".join(f"- {item}" for item in items)
+    # One C-level join instead of a generator and an f-string per item
+    try:
+        return "- " + "\n- ".join(items)
+    except TypeError:  # non-string items from a malformed extraction
+        return "\n".join(f"- {item}" for item in items)
 
 
 def _checkbox_list(items: list[str], empty: str = "_None_") -> str:
     """Format a list as markdown checkboxes. Returns empty marker if no items."""
     if not items:
         return empty
-    return "\n".join(f"- [ ] {item}" for item in items)
+    try:
+        return "- [ ] " + "\n- [ ] ".join(items)
+    except TypeError:
+        return "\n".join(f"- [ ] {item}" for item in items)
 
 
 def _first_or(items: list[str], fallback: str = "—") -> str:
@@ -283,8 +347,8 @@ def render_project(
     recent_dates: list[str] | None = None,
 ) -> str:
     """Render PROJECT.md — hub document with identity info, not temporal content."""
-    updated = updated or datetime.now().strftime("%Y-%m-%d %H:%M")
-    today = datetime.now().strftime("%Y-%m-%d")
+    updated = updated or _now()
+    today = _now("%Y-%m-%d")
 
     # Build decisions table (date + decision + link to daily log)
     decisions_table = _render_decisions_table(extract.decisions, today)
@@ -298,7 +362,7 @@ def render_project(
     # Top blocker for frontmatter
     top_blocker = extract.blockers[0] if extract.blockers else "none"
 
-    return PROJECT_TEMPLATE.format(
+    return _fill_project(
         project_name=project_name,
         updated=updated,
         phase=extract.phase or "_Not specified_",
@@ -340,8 +404,8 @@ def render_dashboard_row(project_name: str, extract, updated: str) -> str:
 
 def render_dashboard(rows: list[str], updated: str | None = None) -> str:
     """Render DASHBOARD.md content."""
-    updated = updated or datetime.now().strftime("%Y-%m-%d %H:%M")
-    return DASHBOARD_TEMPLATE.format(
+    updated = updated or _now()
+    return _fill_dashboard(
         updated=updated,
         rows="\n".join(rows) if rows else "| _No projects yet_ | | | | | | |",
     )
@@ -349,8 +413,8 @@ def render_dashboard(rows: list[str], updated: str | None = None) -> str:
 
 def render_daily_entry(project_name: str, extract, time: str | None = None) -> str:
     """Render a single daily log entry."""
-    time = time or datetime.now().strftime("%H:%M")
-    return DAILY_ENTRY_TEMPLATE.format(
+    time = time or _now("%H:%M")
+    return _fill_daily_entry(
         time=time,
         project_name=project_name,
         summary=extract.summary or "_No summary_",
@@ -368,7 +432,7 @@ def render_daily_entry(project_name: str, extract, time: str | None = None) -> s
 
 def render_daily_header(date: str) -> str:
     """Render the header for a new daily log file."""
-    return DAILY_HEADER_TEMPLATE.format(date=date)
+    return _fill_daily_header(date=date)
 
 
 def render_daily_rollup(
@@ -377,9 +441,9 @@ def render_daily_rollup(
     project_sections: list[str],
 ) -> str:
     """Render cross-project daily rollup."""
-    return DAILY_ROLLUP_TEMPLATE.format(
+    return _fill_daily_rollup(
         date=date,
-        generated=datetime.now().strftime("%Y-%m-%d %H:%M"),
+        generated=_now(),
         summary_rows="\n".join(summary_rows) if summary_rows else "| _No activity_ | | |",
         project_sections="\n".join(project_sections),
     )
@@ -395,7 +459,7 @@ def render_daily_rollup_project(
     github_refs: list[str],
 ) -> str:
     """Render a single project section in the daily rollup."""
-    return DAILY_ROLLUP_PROJECT_SECTION.format(
+    return _fill_daily_rollup_project(
         project_name=project_name,
         status=status or "—",
         completed=_bullet_list(completed),
@@ -414,7 +478,7 @@ def render_rollup_project_section(
     github_refs: list[str],
 ) -> str:
     """Render a project section for multi-project weekly/monthly rollups."""
-    return ROLLUP_PROJECT_SECTION.format(
+    return _fill_rollup_project_section(
         project_name=project_name,
         completed=_bullet_list(completed),
         decisions=_bullet_list(decisions),
@@ -432,9 +496,9 @@ def render_weekly(
     github_refs: list[str],
 ) -> str:
     """Render a weekly rollup for one project."""
-    return WEEKLY_TEMPLATE.format(
+    return _fill_weekly(
         week=week,
-        generated=datetime.now().strftime("%Y-%m-%d %H:%M"),
+        generated=_now(),
         project_name=project_name,
         completed=_bullet_list(completed),
         decisions=_bullet_list(decisions),
@@ -448,9 +512,9 @@ def render_weekly_multi(
     project_sections: list[str],
 ) -> str:
     """Render a cross-project weekly rollup."""
-    return WEEKLY_MULTI_PROJECT_TEMPLATE.format(
+    return _fill_weekly_multi(
         week=week,
-        generated=datetime.now().strftime("%Y-%m-%d %H:%M"),
+        generated=_now(),
         project_sections="\n".join(project_sections),
     )
 
@@ -464,9 +528,9 @@ def render_monthly(
     github_refs: list[str],
 ) -> str:
     """Render a monthly rollup for one project."""
-    return MONTHLY_TEMPLATE.format(
+    return _fill_monthly(
         month=month,
-        generated=datetime.now().strftime("%Y-%m-%d %H:%M"),
+        generated=_now(),
         project_name=project_name,
         completed=_bullet_list(completed),
         decisions=_bullet_list(decisions),
@@ -480,8 +544,8 @@ def render_monthly_multi(
     project_sections: list[str],
 ) -> str:
     """Render a cross-project monthly rollup."""
-    return MONTHLY_MULTI_PROJECT_TEMPLATE.format(
+    return _fill_monthly_multi(
         month=month,
-        generated=datetime.now().strftime("%Y-%m-%d %H:%M"),
+        generated=_now(),
         project_sections="\n".join(project_sections),
     )
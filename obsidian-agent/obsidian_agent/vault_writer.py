@@ -7,9 +7,13 @@ Design:
 - Weekly/Monthly are GENERATED on demand from daily logs
 - Rollups/ contains cross-project aggregations
 """
+import copy
+import functools
+import json
 import os
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
 
 from .config import Config
@@ -29,6 +33,19 @@ from .templates import (
     render_weekly_multi,
 )
 
+# Threads used for independent per-project work (DASHBOARD.md rows, batch
+# weekly/monthly rollups), which mostly waits on file reads and writes
+PROJECT_WORKERS = 8
+
+# Rendered dashboard rows keyed by project, under the vault root (Obsidian
+# ignores dotfiles)
+DASHBOARD_CACHE_FILE = ".dashboard_cache.json"
+# Bump when render_dashboard_row's output changes, so rows cached by an older
+# version are re-rendered instead of reused
+DASHBOARD_CACHE_VERSION = 1
+
+_TEST_RESULTS_RE = re.compile(r"## UI Test Results.*?(?=\n## |\n---|\Z)", re.DOTALL)
+
 
 class VaultWriter:
     """Writes extracted session data to the Obsidian vault."""
@@ -66,6 +83,10 @@ class VaultWriter:
         Preserves user-edited frontmatter (health, priority, category).
         Merges new decisions with existing ones (append-only).
         """
+        return self._write_project(project_name, extract)[0]
+
+    def _write_project(self, project_name: str, extract: SessionExtract) -> tuple[Path, str]:
+        """write_project, also returning the content written."""
         project_dir = self._project_dir(project_name)
         path = project_dir / "PROJECT.md"
 
@@ -94,8 +115,8 @@ class VaultWriter:
             recent_dates = [f.stem for f in daily_files[:5]]
 
         content = render_project(project_name, extract, recent_dates=recent_dates)
-        path.write_text(content)
-        return path
+        _write_atomic(path, content)
+        return path, content
 
     def write_daily(self, project_name: str, extract: SessionExtract, date: str = "") -> Path:
         """Append a session entry to the daily log.
@@ -107,13 +128,17 @@ class VaultWriter:
         log_dir = self._log_dir(project_name, "Daily")
         path = log_dir / f"{date}.md"
 
-        if not path.exists():
-            path.write_text(render_daily_header(date))
-
         entry = render_daily_entry(project_name, extract)
 
+        # First entry of the day: header and entry in one write, with no
+        # read-back (the header alone can't hold a project entry to merge)
+        try:
+            existing = _read_text(path)
+        except FileNotFoundError:
+            path.write_text(render_daily_header(date) + entry, encoding="utf-8")
+            return path
+
         # Check for existing entry for this project today
-        existing = path.read_text()
         project_header = f"— {project_name}"
         summary_line = f"**Summary**: {extract.summary or '_No summary_'}"
 
@@ -124,46 +149,95 @@ class VaultWriter:
         # Consolidation: if project already has an entry today, replace it
         if project_header in existing:
             consolidated = self._consolidate_daily_entry(existing, project_name, extract)
-            # Atomic write: write to temp then replace
-            tmp = path.with_suffix(".tmp")
-            tmp.write_text(consolidated)
-            os.replace(tmp, path)
+            _write_atomic(path, consolidated)
             return path
 
         # No existing entry — append
-        with open(path, "a") as f:
+        with open(path, "a", encoding="utf-8") as f:
             f.write(entry)
 
         return path
 
-    def write_dashboard(self) -> Path:
-        """Overwrite DASHBOARD.md by reading all PROJECT.md files."""
-        rows = []
-
+    def write_dashboard(self, *, authoritative: dict[str, SessionExtract] | None = None) -> Path:
+        """Overwrite DASHBOARD.md by reading all PROJECT.md files.
+
+        Project files are read and parsed on the per-project thread pool;
+        rows come back in sorted project order and the dashboard is written
+        once.
+        Rendered rows are cached in DASHBOARD_CACHE_FILE by project file
+        mtime and size, so only projects whose file changed are re-parsed.
+        authoritative maps project names to an already-parsed project file
+        (e.g. the PROJECT.md update() just wrote), used instead of reading
+        it back.
+        """
         if not self.projects.exists():
             dashboard = self.vault / "DASHBOARD.md"
-            dashboard.write_text(render_dashboard([]))
+            _write_atomic(dashboard, render_dashboard([]))
             return dashboard
 
-        for project_dir in sorted(self.projects.iterdir()):
-            if not project_dir.is_dir():
-                continue
-            # Support both PROJECT.md (new) and STATUS.md (legacy)
-            project_file = project_dir / "PROJECT.md"
-            if not project_file.exists():
-                project_file = project_dir / "STATUS.md"
-            if not project_file.exists():
-                continue
-
-            project_name = project_dir.name
-            extract = self._parse_project_file(project_file)
-            updated = self._get_file_date(project_file)
-            rows.append(render_dashboard_row(project_name, extract, updated))
+        cache_path = self.vault / DASHBOARD_CACHE_FILE
+        try:
+            cache = json.loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            cache = {}
+        if not isinstance(cache, dict):
+            cache = {}
+
+        project_dirs = [d for d in sorted(self.projects.iterdir()) if d.is_dir()]
+        authoritative = authoritative or {}
+        results = self._map_projects(
+            lambda d: self._dashboard_row(d, cache.get(d.name), authoritative.get(d.name)),
+            project_dirs,
+        )
+        entries = {d.name: e for d, e in zip(project_dirs, results) if e is not None}
 
         dashboard = self.vault / "DASHBOARD.md"
-        dashboard.write_text(render_dashboard(rows))
+        _write_atomic(dashboard, render_dashboard([e["row"] for e in entries.values()]))
+
+        if entries != cache:
+            _write_atomic(cache_path, json.dumps(entries))
         return dashboard
 
+    def _dashboard_row(
+        self, project_dir: Path, cached: dict | None, extract: SessionExtract | None = None
+    ) -> dict | None:
+        """Build one project's dashboard cache entry, or None if it has no project file.
+
+        Reuses cached["row"] when it was rendered by this DASHBOARD_CACHE_VERSION
+        from the same file with the same mtime and size; otherwise renders from extract, if given, or
+        from the parsed project file.
+        """
+        # Support both PROJECT.md (new) and STATUS.md (legacy)
+        for name in ("PROJECT.md", "STATUS.md"):
+            project_file = project_dir / name
+            try:
+                st = project_file.stat()
+                break
+            except OSError:
+                continue
+        else:
+            return None
+
+        entry = {
+            "version": DASHBOARD_CACHE_VERSION,
+            "file": name,
+            "mtime": st.st_mtime_ns,
+            "size": st.st_size,
+        }
+        if (
+            isinstance(cached, dict)
+            and type(cached.get("row")) is str
+            and all(cached.get(k) == entry[k] for k in ("version", "file", "mtime", "size"))
+        ):
+            entry["row"] = cached["row"]
+            return entry
+
+        if extract is None:
+            extract = self._parse_project_file(project_file)
+        updated = date.fromtimestamp(st.st_mtime).isoformat()
+        entry["row"] = render_dashboard_row(project_dir.name, extract, updated)
+        return entry
+
     # ------------------------------------------------------------------
     # Rollup generation (per-project)
     # ------------------------------------------------------------------
@@ -182,7 +256,7 @@ class VaultWriter:
         weekly_dir = self._log_dir(project_name, "Weekly")
         path = weekly_dir / f"{week}.md"
         content = render_weekly(week, project_name, completed, decisions, blockers, github_refs)
-        path.write_text(content)
+        path.write_text(content, encoding="utf-8")
         return path
 
     def generate_monthly(self, project_name: str, month: str = "") -> Path:
@@ -198,28 +272,37 @@ class VaultWriter:
         monthly_dir = self._log_dir(project_name, "Monthly")
         path = monthly_dir / f"{month}.md"
         content = render_monthly(month, project_name, completed, decisions, blockers, github_refs)
-        path.write_text(content)
+        path.write_text(content, encoding="utf-8")
         return path
 
     def generate_weekly_all(self, week: str = "") -> list[Path]:
         """Generate weekly rollups for all projects."""
-        paths = []
-        if not self.projects.exists():
-            return paths
-        for project_dir in sorted(self.projects.iterdir()):
-            if project_dir.is_dir() and (project_dir / "Log" / "Daily").exists():
-                paths.append(self.generate_weekly(project_dir.name, week))
-        return paths
+        return self._map_projects(lambda name: self.generate_weekly(name, week), self._logged_projects())
 
     def generate_monthly_all(self, month: str = "") -> list[Path]:
         """Generate monthly rollups for all projects."""
-        paths = []
+        return self._map_projects(lambda name: self.generate_monthly(name, month), self._logged_projects())
+
+    def _logged_projects(self) -> list[str]:
+        """Names of projects that have a Log/Daily directory, sorted."""
         if not self.projects.exists():
-            return paths
-        for project_dir in sorted(self.projects.iterdir()):
-            if project_dir.is_dir() and (project_dir / "Log" / "Daily").exists():
-                paths.append(self.generate_monthly(project_dir.name, month))
-        return paths
+            return []
+        return [
+            project_dir.name
+            for project_dir in sorted(self.projects.iterdir())
+            if project_dir.is_dir() and (project_dir / "Log" / "Daily").exists()
+        ]
+
+    @staticmethod
+    def _map_projects(fn, items: list) -> list:
+        """Apply fn to each item on a thread pool, returning results in order.
+
+        Per-project work is independent and touches only that project's
+        files; results come back in input order like a plain loop.
+        """
+        workers = max(1, min(PROJECT_WORKERS, len(items)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(fn, items))
 
     # ------------------------------------------------------------------
     # Cross-project rollups (NEW)
@@ -245,7 +328,7 @@ class VaultWriter:
                     continue
 
                 project_name = project_dir.name
-                content = daily_file.read_text()
+                content = _read_text(daily_file)
 
                 # Get status from STATUS.md
                 status_text = "—"
@@ -277,7 +360,7 @@ class VaultWriter:
                 ))
 
         content = render_daily_rollup(date, summary_rows, project_sections)
-        path.write_text(content)
+        path.write_text(content, encoding="utf-8")
         return path
 
     def generate_weekly_rollup(self, week: str = "") -> Path:
@@ -314,7 +397,7 @@ class VaultWriter:
                 ))
 
         content = render_weekly_multi(week, project_sections)
-        path.write_text(content)
+        path.write_text(content, encoding="utf-8")
         return path
 
     def generate_monthly_rollup(self, month: str = "") -> Path:
@@ -349,7 +432,7 @@ class VaultWriter:
                 ))
 
         content = render_monthly_multi(month, project_sections)
-        path.write_text(content)
+        path.write_text(content, encoding="utf-8")
         return path
 
     # ------------------------------------------------------------------
@@ -358,9 +441,13 @@ class VaultWriter:
 
     def update(self, project_name: str, extract: SessionExtract, date: str = "") -> dict[str, Path]:
         """Full update: PROJECT + Daily + DASHBOARD + Test Results."""
-        status_path = self.write_project(project_name, extract)
+        status_path, project_content = self._write_project(project_name, extract)
         daily_path = self.write_daily(project_name, extract, date)
-        dashboard_path = self.write_dashboard()
+        # The dashboard row for this project comes from the PROJECT.md text
+        # just written, parsed in memory instead of read back from disk
+        dashboard_path = self.write_dashboard(
+            authoritative={project_name: self._parse_project_content(project_content)}
+        )
 
         # Append test results if a test plan exists for this project
         test_path = self.write_test_results(project_name, date)
@@ -407,19 +494,14 @@ class VaultWriter:
 
                 # Check if test results already written today
                 if daily_path.exists():
-                    existing = daily_path.read_text()
+                    existing = _read_text(daily_path)
                     if "## UI Test Results" in existing:
                         # Replace existing test results section
-                        import re as _re
-                        pattern = r"## UI Test Results.*?(?=\n## |\n---|\Z)"
-                        new_content = _re.sub(pattern, summary, existing, flags=_re.DOTALL)
-                        tmp = daily_path.with_suffix(".tmp")
-                        tmp.write_text(new_content)
-                        os.replace(tmp, daily_path)
+                        _write_atomic(daily_path, _TEST_RESULTS_RE.sub(summary, existing))
                         return daily_path
 
                 # Append new test results section
-                with open(daily_path, "a") as f:
+                with open(daily_path, "a", encoding="utf-8") as f:
                     f.write(f"\n---\n\n{summary}\n")
                 return daily_path
 
@@ -433,7 +515,7 @@ class VaultWriter:
     def _parse_frontmatter(path: Path) -> dict[str, str]:
         """Parse YAML frontmatter from a markdown file."""
         try:
-            content = path.read_text()
+            content = _read_text(path)
         except OSError:
             return {}
 
@@ -453,9 +535,19 @@ class VaultWriter:
 
     @staticmethod
     def _parse_project_file(path: Path) -> SessionExtract:
-        """Parse a PROJECT.md (or legacy STATUS.md) into a minimal SessionExtract."""
-        content = path.read_text()
+        """Parse a PROJECT.md (or legacy STATUS.md) into a minimal SessionExtract.
+
+        Memoized on (path, mtime_ns, size): update() rebuilds the dashboard
+        after every session, re-reading every project file, and most of them
+        haven't changed since the last pass. Callers get a copy, so they
+        can't mutate the cached extract.
+        """
+        st = path.stat()
+        return copy.deepcopy(_parse_project_cached(str(path), st.st_mtime_ns, st.st_size))
 
+    @staticmethod
+    def _parse_project_content(content: str) -> SessionExtract:
+        """Parse PROJECT.md/STATUS.md text into a minimal SessionExtract."""
         # Parse frontmatter for metadata
         meta = {}
         if content.startswith("---"):
@@ -467,11 +559,10 @@ class VaultWriter:
                         meta[key.strip()] = value.strip()
 
         def _section(header: str) -> list[str]:
-            pattern = rf"## {header}\n(.*?)(?=\n## |\Z)"
-            m = re.search(pattern, content, re.DOTALL)
-            if not m:
+            body = _section_body(content, header)
+            if body is None:
                 return []
-            text = m.group(1).strip()
+            text = body.strip()
             if text in ("_None_", "_Unknown_", "_Not specified_"):
                 return []
             items = []
@@ -486,11 +577,10 @@ class VaultWriter:
             return items
 
         def _section_text(header: str) -> str:
-            pattern = rf"## {header}\n(.*?)(?=\n## |\Z)"
-            m = re.search(pattern, content, re.DOTALL)
-            if not m:
+            body = _section_body(content, header)
+            if body is None:
                 return ""
-            text = m.group(1).strip()
+            text = body.strip()
             return "" if text.startswith("_") else text
 
         return SessionExtract(
@@ -511,7 +601,7 @@ class VaultWriter:
     def _get_file_date(path: Path) -> str:
         """Get the last-modified date of a file as YYYY-MM-DD."""
         mtime = path.stat().st_mtime
-        return datetime.fromtimestamp(mtime).strftime("%Y-%m-%d")
+        return date.fromtimestamp(mtime).isoformat()
 
     @staticmethod
     def _consolidate_daily_entry(
@@ -522,24 +612,25 @@ class VaultWriter:
         Merges completed items, decisions, blockers etc. from the existing
         section with the new extract, then replaces the section in place.
         """
-        # Split on section dividers
-        sections = re.split(r"\n---\n", existing_content)
-
-        new_sections = []
-        replaced = False
-
-        for section in sections:
-            if f"— {project_name}" in section and not replaced:
-                # This is the section to replace — render fresh with new extract
-                new_entry = render_daily_entry(project_name, new_extract)
-                # Strip leading newlines since we re-join with \n---\n
-                new_entry = new_entry.lstrip("\n")
-                new_sections.append(new_entry)
-                replaced = True
-            else:
-                new_sections.append(section)
+        # Locate the first section (between \n---\n dividers) naming the
+        # project and splice the fresh entry in, instead of splitting the
+        # whole log into a list and joining it back together
+        idx = existing_content.find(f"— {project_name}")
+        if idx < 0:
+            return existing_content
+
+        # Walk dividers left to right (as str.split does) to the section start
+        start = 0
+        while (div := existing_content.find("\n---\n", start)) >= 0 and div < idx:
+            start = div + 5
+        end = existing_content.find("\n---\n", start)
+        if end < 0:
+            end = len(existing_content)
 
-        return "\n---\n".join(new_sections)
+        # Render fresh with new extract; strip leading newlines since the
+        # entry sits directly after a divider
+        new_entry = render_daily_entry(project_name, new_extract).lstrip("\n")
+        return existing_content[:start] + new_entry + existing_content[end:]
 
     @staticmethod
     def _aggregate_dailies(
@@ -559,23 +650,20 @@ class VaultWriter:
         if not daily_dir.exists():
             return completed, decisions, blockers, github_refs
 
-        for daily_file in sorted(daily_dir.glob("*.md")):
-            file_date = daily_file.stem  # YYYY-MM-DD
-
-            # Filter by period
-            if week:
-                try:
-                    dt = datetime.strptime(file_date, "%Y-%m-%d")
-                    file_week = f"{dt.year}-W{dt.isocalendar()[1]:02d}"
-                    if file_week != week:
-                        continue
-                except ValueError:
-                    continue
-            elif month:
-                if not file_date.startswith(month):
-                    continue
+        # Filter on the file name (YYYY-MM-DD.md) before reading anything;
+        # a month is a plain prefix test, so those are dropped pre-sort
+        with os.scandir(daily_dir) as entries:
+            names = [
+                e.name for e in entries
+                if e.name.endswith(".md") and (week or e.name.startswith(month)) and e.is_file()
+            ]
+
+        for name in sorted(names):
+            file_date = name[:-3]  # YYYY-MM-DD
+            if week and _week_label(file_date) != week:
+                continue
 
-            content = daily_file.read_text()
+            content = _read_text(daily_dir / name)
 
             # Extract bullet items from each section
             completed.extend(_extract_section_bullets(content, "Completed"))
@@ -594,15 +682,117 @@ class VaultWriter:
         return completed, decisions, blockers, github_refs
 
 
+def _write_atomic(path: Path, content: str) -> None:
+    """Replace path's content in one rename, so readers never see a partial file.
+
+    Used for the files rewritten on every session (PROJECT.md, DASHBOARD.md,
+    consolidated dailies); Obsidian and sync clients pick up either the old
+    version or the new one.
+    """
+    tmp = path.with_suffix(".tmp")
+    try:
+        tmp.write_text(content, encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        # Don't leave a stray .tmp in the vault for sync clients to pick up
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _read_text(path: Path) -> str:
+    """Read a vault file as UTF-8, with the same newline handling as read_text().
+
+    read_bytes() + decode skips building a TextIOWrapper per file; \r\n and
+    lone \r are still translated to \n as universal-newlines mode does.
+    """
+    content = path.read_bytes().decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_project_cached(path: str, mtime_ns: int, size: int) -> SessionExtract:
+    # mtime_ns and size only key the cache; a rewrite changes one of them
+    return VaultWriter._parse_project_content(_read_text(Path(path)))
+
+
+@functools.cache
+def _week_label(file_date: str) -> str | None:
+    """Rollup week label ("YYYY-Www") for a daily file's date, or None.
+
+    Cached: every weekly rollup re-labels the same daily file names for
+    each project. Note the year is the calendar year, not the ISO year.
+    """
+    digits = file_date[:4] + file_date[5:7] + file_date[8:]
+    try:
+        if len(file_date) == 10 and file_date[4] == file_date[7] == "-" and digits.isascii() and digits.isdigit():
+            # Zero-padded names (all the writer produces): skip strptime
+            dt = datetime(int(digits[:4]), int(digits[4:6]), int(digits[6:]))
+        else:
+            dt = datetime.strptime(file_date, "%Y-%m-%d")
+    except ValueError:
+        return None
+    return f"{dt.year}-W{dt.isocalendar()[1]:02d}"
+
+
+# Section lookups below use str.find instead of DOTALL regex searches. Each
+# reproduces the lazy-match-to-lookahead pattern it replaced exactly: the
+# body starts after the first occurrence of the header text (wherever it
+# is) and ends at the earliest stop string, or at the end of the file.
+
+
+def _body_end(content: str, start: int, stops: tuple[str, ...]) -> int:
+    """Earliest index >= start at which one of stops begins, else len(content)."""
+    ends = [i for stop in stops if (i := content.find(stop, start)) >= 0]
+    return min(ends) if ends else len(content)
+
+
+def _next_h2(content: str, start: int) -> int:
+    """Start of the next `\n## X` with X not '#' (a level-2 heading), else -1."""
+    i = content.find("\n## ", start)
+    while i >= 0 and content[i + 4:i + 5] in ("#", ""):
+        i = content.find("\n## ", i + 1)
+    return i
+
+
+def _section_body(content: str, header: str) -> str | None:
+    """Body of the first `## Header` line's section, up to the next `## `."""
+    marker = f"## {header}\n"
+    start = content.find(marker)
+    if start < 0:
+        return None
+    start += len(marker)
+    return content[start:_body_end(content, start, ("\n## ",))]
+
+
+def _bold_section_body(content: str, header: str) -> str | None:
+    """Body of the first `**Header**:` section, up to `\n**`, `\n---` or `\n###`."""
+    marker = f"**{header}**:\n"
+    start = content.find(marker)
+    if start < 0:
+        return None
+    start += len(marker)
+    return content[start:_body_end(content, start, ("\n**", "\n---", "\n###"))]
+
+
+def _heading_line_end(content: str, header: str) -> int:
+    """Index just past the line holding the first `## Header...`, or -1."""
+    start = content.find(f"## {header}")
+    if start < 0:
+        return -1
+    eol = content.find("\n", start + 3 + len(header))
+    return eol + 1 if eol >= 0 else -1
+
+
 def _extract_section_bullets(content: str, header: str) -> list[str]:
     """Extract bullet items from a **Header**: or ## Header section in daily logs."""
     items = []
 
     # Try **Header**: format first (daily entry style)
-    pattern = rf"\*\*{header}\*\*:\n(.*?)(?=\n\*\*|\n---|\n###|\Z)"
-    match = re.search(pattern, content, re.DOTALL)
-    if match:
-        for line in match.group(1).strip().splitlines():
+    body = _bold_section_body(content, header)
+    if body is not None:
+        for line in body.strip().splitlines():
             line = line.strip()
             if line.startswith("- ") and line != "- _None_":
                 items.append(line[2:].strip())
@@ -610,10 +800,13 @@ def _extract_section_bullets(content: str, header: str) -> list[str]:
 
     # Try ## Header format (daily entry sections)
     # Don't stop at ### since completed items may be under ### sub-headings
-    pattern = rf"## {header}[^\n]*\n(.*?)(?=\n## [^#]|\n---|\Z)"
-    match = re.search(pattern, content, re.DOTALL)
-    if match:
-        for line in match.group(1).strip().splitlines():
+    start = _heading_line_end(content, header)
+    if start >= 0:
+        h2 = _next_h2(content, start)
+        end = _body_end(content, start, ("\n---",))
+        if 0 <= h2 < end:
+            end = h2
+        for line in content[start:end].strip().splitlines():
             line = line.strip()
             if line.startswith("- _None_"):
                 continue
@@ -630,10 +823,10 @@ def _extract_section_bullets(content: str, header: str) -> list[str]:
 def _extract_section_items(content: str, header: str) -> list[str]:
     """Extract items from a ## Header section, handling checkboxes."""
     items = []
-    pattern = rf"## {header}[^\n]*\n(.*?)(?=\n## |\n---|\n###|\Z)"
-    match = re.search(pattern, content, re.DOTALL)
-    if match:
-        for line in match.group(1).strip().splitlines():
+    start = _heading_line_end(content, header)
+    if start >= 0:
+        end = _body_end(content, start, ("\n## ", "\n---", "\n###"))
+        for line in content[start:end].strip().splitlines():
             line = line.strip()
             if line.startswith("- _None_"):
                 continue
@@ -648,6 +841,9 @@ def _extract_section_items(content: str, header: str) -> list[str]:
 
 def _extract_github_refs(content: str) -> list[str]:
     """Extract GitHub refs from **GitHub Refs**: lines."""
+    # Most dailies have no refs line; skip splitting them into lines
+    if "**GitHub Refs**:" not in content:
+        return []
     refs = []
     for line in content.splitlines():
         if line.startswith("**GitHub Refs**:"):
@@ -658,11 +854,5 @@ def _extract_github_refs(content: str) -> list[str]:
 
 
 def _dedup(items: list[str]) -> list[str]:
-    """Deduplicate list while preserving order."""
-    seen: set[str] = set()
-    result = []
-    for item in items:
-        if item not in seen:
-            seen.add(item)
-            result.append(item)
-    return result
+    """Deduplicate list while preserving order (dicts keep insertion order)."""
+    return list(dict.fromkeys(items))
@@ -0,0 +1,120 @@
+"""Tests for the dashboard row cache in obsidian_agent/vault_writer.py."""
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from obsidian_agent import vault_writer
+from obsidian_agent.config import Config
+from obsidian_agent.extractor import SessionExtract
+from obsidian_agent.vault_writer import (
+    DASHBOARD_CACHE_FILE,
+    DASHBOARD_CACHE_VERSION,
+    VaultWriter,
+)
+
+
+@pytest.fixture
+def writer(tmp_path):
+    config = Config(
+        vault_path=tmp_path / "vault",
+        claude_projects_path=tmp_path / "claude",
+        projects_folder="Projects",
+        extraction_model="haiku",
+        max_conversation_chars=50000,
+    )
+    w = VaultWriter(config)
+    for name in ("alpha", "beta"):
+        w.update(name, SessionExtract(status=f"{name} status", phase=f"{name} phase", summary="s"))
+    return w
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Record every project file the dashboard has to parse."""
+    calls = []
+    real = VaultWriter._parse_project_file
+
+    def counting(path):
+        calls.append(path.parent.name)
+        return real(path)
+
+    monkeypatch.setattr(VaultWriter, "_parse_project_file", staticmethod(counting))
+    return calls
+
+
+def _cache(writer) -> dict:
+    return json.loads((writer.vault / DASHBOARD_CACHE_FILE).read_text(encoding="utf-8"))
+
+
+def _dashboard(writer) -> str:
+    return (writer.vault / "DASHBOARD.md").read_text(encoding="utf-8")
+
+
+def test_entries_carry_the_cache_version(writer):
+    cache = _cache(writer)
+    assert sorted(cache) == ["alpha", "beta"]
+    assert all(e["version"] == DASHBOARD_CACHE_VERSION for e in cache.values())
+
+
+def test_unchanged_projects_are_not_reparsed(writer, parses):
+    before = _dashboard(writer)
+    writer.write_dashboard()
+    assert parses == []
+    assert _dashboard(writer) == before
+
+
+def test_edited_project_is_reparsed(writer, parses):
+    project = writer.projects / "beta" / "PROJECT.md"
+    project.write_text(
+        project.read_text(encoding="utf-8").replace("beta phase", "beta phase two"), encoding="utf-8"
+    )
+    os.utime(project, ns=(project.stat().st_mtime_ns + 10**9,) * 2)
+    writer.write_dashboard()
+    assert parses == ["beta"]
+    assert "beta phase two" in _dashboard(writer)
+
+
+def test_version_mismatch_is_rerendered(writer, parses, monkeypatch):
+    before = _dashboard(writer)
+    monkeypatch.setattr(vault_writer, "DASHBOARD_CACHE_VERSION", DASHBOARD_CACHE_VERSION + 1)
+    writer.write_dashboard()
+    assert sorted(parses) == ["alpha", "beta"]
+    assert _dashboard(writer) == before
+    assert all(e["version"] == DASHBOARD_CACHE_VERSION + 1 for e in _cache(writer).values())
+
+
+def test_entry_without_version_is_rerendered(writer, parses):
+    cache = _cache(writer)
+    for entry in cache.values():
+        del entry["version"]
+        entry["row"] = "| stale |"
+    (writer.vault / DASHBOARD_CACHE_FILE).write_text(json.dumps(cache), encoding="utf-8")
+    writer.write_dashboard()
+    assert sorted(parses) == ["alpha", "beta"]
+    assert "stale" not in _dashboard(writer)
+
+
+@pytest.mark.parametrize("content", ["{not json", "[1, 2]", '{"alpha": "row", "beta": {"row": 3}}'])
+def test_corrupt_cache_is_rebuilt(writer, parses, content):
+    before = _dashboard(writer)
+    (writer.vault / DASHBOARD_CACHE_FILE).write_text(content, encoding="utf-8")
+    writer.write_dashboard()
+    assert sorted(parses) == ["alpha", "beta"]
+    assert _dashboard(writer) == before
+    assert sorted(_cache(writer)) == ["alpha", "beta"]
+
+
+def test_failed_atomic_write_leaves_no_tmp_in_vault(writer, monkeypatch):
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(vault_writer.os, "replace", fail)
+    with pytest.raises(OSError):
+        writer.write_dashboard()
+    assert not list(writer.vault.rglob("*.tmp"))
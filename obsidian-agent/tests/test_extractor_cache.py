@@ -0,0 +1,120 @@
+"""Tests for obsidian_agent/extractor_cache.py and its use in extract_with_claude."""
+from __future__ import annotations
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from obsidian_agent import extractor, extractor_cache
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    d = tmp_path / "extract"
+    monkeypatch.setattr(extractor_cache, "CACHE_DIR", d)
+    return d
+
+
+def test_cache_key_is_length_prefixed():
+    assert extractor_cache.cache_key("ab", "c") != extractor_cache.cache_key("a", "bc")
+    assert extractor_cache.cache_key("a", "b") == extractor_cache.cache_key("a", "b")
+    assert len(extractor_cache.cache_key()) == 64
+
+
+def test_put_then_get_round_trips(cache_dir):
+    key = extractor_cache.cache_key("x")
+    assert extractor_cache.get(key) is None
+    extractor_cache.put(key, {"status": "ok", "items": ["é"]})
+    assert extractor_cache.get(key) == {"status": "ok", "items": ["é"]}
+    assert [p.name for p in cache_dir.iterdir()] == [f"{key}.json"]
+
+
+def test_corrupt_and_non_dict_entries_are_misses(cache_dir):
+    cache_dir.mkdir()
+    (cache_dir / "bad.json").write_text("{not json")
+    (cache_dir / "list.json").write_text("[1, 2]")
+    assert extractor_cache.get("bad") is None
+    assert extractor_cache.get("list") is None
+
+
+def test_ttl_expiry(cache_dir):
+    extractor_cache.put("k", {"a": 1})
+    old = time.time() - 3 * 86400
+    os.utime(cache_dir / "k.json", (old, old))
+    assert extractor_cache.get("k", ttl_days=4) == {"a": 1}
+    assert extractor_cache.get("k", ttl_days=0) == {"a": 1}
+    assert extractor_cache.get("k", ttl_days=2) is None
+    # The expired entry is deleted, not just skipped
+    assert not (cache_dir / "k.json").exists()
+
+
+def _failing_replace(src, dst):
+    raise OSError("disk full")
+
+
+def test_put_failure_is_swallowed_and_cleans_up(cache_dir, monkeypatch):
+    monkeypatch.setattr(extractor_cache.os, "replace", _failing_replace)
+    extractor_cache.put("k", {"a": 1})
+    assert list(cache_dir.iterdir()) == []
+    assert extractor_cache.get("k") is None
+
+
+def test_put_into_unwritable_cache_dir_is_swallowed(tmp_path, monkeypatch):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    monkeypatch.setattr(extractor_cache, "CACHE_DIR", blocker / "extract")
+    extractor_cache.put("k", {"a": 1})
+    assert extractor_cache.get("k") is None
+
+
+def test_extract_with_claude_survives_cache_write_failure(monkeypatch):
+    calls = _fake_runs(monkeypatch)
+    monkeypatch.setattr(extractor_cache.os, "replace", _failing_replace)
+    assert extractor.extract_with_claude("conv").status == "from cli"
+    assert calls == [("cli", "haiku")]
+
+
+def _fake_runs(monkeypatch):
+    calls = []
+
+    def runner(name):
+        def run(conversation_text, model):
+            calls.append((name, model))
+            return {"status": f"from {name}", "summary": "s"}
+        return run
+
+    monkeypatch.setattr(extractor, "_run_claude", runner("cli"))
+    monkeypatch.setattr(extractor, "_run_api", runner("api"))
+    return calls
+
+
+def test_extract_with_claude_caches_per_backend(monkeypatch):
+    calls = _fake_runs(monkeypatch)
+    assert extractor.extract_with_claude("conv", backend="cli").status == "from cli"
+    assert extractor.extract_with_claude("conv", backend="cli").status == "from cli"
+    assert calls == [("cli", "haiku")]
+
+    # Same model and conversation on the other backend is a separate entry
+    assert extractor.extract_with_claude("conv", backend="api").status == "from api"
+    assert extractor.extract_with_claude("conv", backend="api").status == "from api"
+    assert calls == [("cli", "haiku"), ("api", "haiku")]
+
+
+def test_extract_with_claude_keys_on_model_and_conversation(monkeypatch):
+    calls = _fake_runs(monkeypatch)
+    extractor.extract_with_claude("conv")
+    extractor.extract_with_claude("conv", model="sonnet")
+    extractor.extract_with_claude("other")
+    assert len(calls) == 3
+
+
+def test_extract_with_claude_without_cache(monkeypatch, cache_dir):
+    calls = _fake_runs(monkeypatch)
+    extractor.extract_with_claude("conv", use_cache=False)
+    extractor.extract_with_claude("conv", use_cache=False)
+    assert len(calls) == 2
+    assert not cache_dir.exists()
@@ -0,0 +1,67 @@
+"""Tests that the compiled templates in obsidian_agent/templates.py match str.format."""
+from __future__ import annotations
+
+import string
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from obsidian_agent import templates
+
+COMPILED = [
+    ("PROJECT_TEMPLATE", "_fill_project"),
+    ("DASHBOARD_TEMPLATE", "_fill_dashboard"),
+    ("DAILY_ENTRY_TEMPLATE", "_fill_daily_entry"),
+    ("DAILY_HEADER_TEMPLATE", "_fill_daily_header"),
+    ("DAILY_ROLLUP_TEMPLATE", "_fill_daily_rollup"),
+    ("DAILY_ROLLUP_PROJECT_SECTION", "_fill_daily_rollup_project"),
+    ("WEEKLY_TEMPLATE", "_fill_weekly"),
+    ("WEEKLY_MULTI_PROJECT_TEMPLATE", "_fill_weekly_multi"),
+    ("MONTHLY_TEMPLATE", "_fill_monthly"),
+    ("MONTHLY_MULTI_PROJECT_TEMPLATE", "_fill_monthly_multi"),
+    ("ROLLUP_PROJECT_SECTION", "_fill_rollup_project_section"),
+]
+
+
+def _fields(template: str) -> list[str]:
+    return [name for _, name, _, _ in string.Formatter().parse(template) if name is not None]
+
+
+def test_every_template_constant_is_compiled():
+    constants = {
+        name
+        for name, value in vars(templates).items()
+        if name.isupper() and isinstance(value, str) and _fields(value)
+    }
+    assert constants == {name for name, _ in COMPILED}
+
+
+@pytest.mark.parametrize(("template_name", "fill_name"), COMPILED)
+def test_compiled_matches_str_format(template_name, fill_name):
+    template = getattr(templates, template_name)
+    fill = getattr(templates, fill_name)
+    kwargs = {
+        name: f"<{name} {{x}} 'q' \"dq\" \\ é\n>" for name in _fields(template)
+    }
+    assert fill(**kwargs) == template.format(**kwargs)
+
+
+@pytest.mark.parametrize(("template_name", "fill_name"), COMPILED)
+def test_compiled_ignores_extra_keywords_like_str_format(template_name, fill_name):
+    template = getattr(templates, template_name)
+    fill = getattr(templates, fill_name)
+    kwargs = {name: name.upper() for name in _fields(template)}
+    kwargs["not_a_field"] = "unused"
+    assert fill(**kwargs) == template.format(**kwargs)
+
+
+def test_compile_template_without_fields_accepts_keywords():
+    render = templates._compile_template("no fields {{here}}\n")
+    assert render(extra=1) == "no fields {here}\n"
+
+
+def test_compile_template_rejects_format_specs():
+    with pytest.raises(ValueError):
+        templates._compile_template("{value:>5}")
@@ -0,0 +1,179 @@
+"""Tests for --skip-existing: peek_project_path and the processed-sessions record."""
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from obsidian_agent import __main__ as cli
+from obsidian_agent.config import Config
+from obsidian_agent.parser import parse_session_log, peek_project_path
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    d = tmp_path / "cache"
+    monkeypatch.setattr(cli, "CACHE_DIR", d)
+    monkeypatch.setattr(cli, "PROCESSED_FILE", d / "processed.json")
+    return d
+
+
+@pytest.fixture
+def config(tmp_path):
+    return Config(
+        vault_path=tmp_path / "vault",
+        claude_projects_path=tmp_path / "claude",
+        projects_folder="Projects",
+        extraction_model="haiku",
+        max_conversation_chars=50000,
+    )
+
+
+def _entry(cwd, session_id="s1", text="hi"):
+    return {
+        "type": "user",
+        "sessionId": session_id,
+        "cwd": cwd,
+        "timestamp": "2026-01-02T03:04:05Z",
+        "message": {"role": "user", "content": text},
+    }
+
+
+def _write_log(path: Path, entries):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(json.dumps(e) + "\n" for e in entries), encoding="utf-8")
+    return path
+
+
+def _write_project_note(config, name="alpha"):
+    note = config.projects_path / name / "PROJECT.md"
+    note.parent.mkdir(parents=True, exist_ok=True)
+    note.write_text("# alpha\n", encoding="utf-8")
+    return note
+
+
+@pytest.mark.parametrize(
+    "entries",
+    [
+        [_entry("/p/alpha"), _entry("/p/beta")],
+        [_entry("/p/alpha", session_id=""), _entry("/p/beta", session_id="")],
+        [_entry("/p/alpha", session_id=""), _entry("/p/beta"), _entry("/p/gamma")],
+        [{"type": "summary", "cwd": "/p/x"}, _entry("/p/alpha")],
+    ],
+)
+def test_peek_project_path_matches_parse_session_log(tmp_path, entries):
+    log = _write_log(tmp_path / "s.jsonl", entries)
+    assert peek_project_path(log) == parse_session_log(log).project_path
+
+
+def test_peek_project_path_empty_log(tmp_path):
+    log = _write_log(tmp_path / "s.jsonl", [])
+    assert peek_project_path(log) == ""
+
+
+def test_not_up_to_date_when_never_processed(tmp_path, config):
+    log = _write_log(tmp_path / "s.jsonl", [_entry("/p/alpha")])
+    _write_project_note(config)
+    assert not cli._is_up_to_date(log, config)
+
+
+def test_up_to_date_after_processing(tmp_path, config):
+    log = _write_log(tmp_path / "s.jsonl", [_entry("/p/alpha")])
+    _write_project_note(config)
+    cli._mark_processed(log, cli._log_stamp(log))
+    assert cli._is_up_to_date(log, config)
+
+
+def test_other_session_writing_project_note_does_not_skip(tmp_path, config):
+    mine = _write_log(tmp_path / "mine.jsonl", [_entry("/p/alpha", session_id="a")])
+    other = _write_log(tmp_path / "other.jsonl", [_entry("/p/alpha", session_id="b")])
+    note = _write_project_note(config)
+    cli._mark_processed(other, cli._log_stamp(other))
+    # The note is newer than this log, but this log was never written to it
+    os.utime(note, ns=(mine.stat().st_mtime_ns + 10**9,) * 2)
+    assert cli._is_up_to_date(other, config)
+    assert not cli._is_up_to_date(mine, config)
+
+
+def test_changed_log_is_not_up_to_date(tmp_path, config):
+    log = _write_log(tmp_path / "s.jsonl", [_entry("/p/alpha")])
+    _write_project_note(config)
+    cli._mark_processed(log, cli._log_stamp(log))
+    with log.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(_entry("/p/alpha", text="more")) + "\n")
+    assert not cli._is_up_to_date(log, config)
+
+
+def test_missing_project_note_is_not_up_to_date(tmp_path, config):
+    log = _write_log(tmp_path / "s.jsonl", [_entry("/p/alpha")])
+    cli._mark_processed(log, cli._log_stamp(log))
+    assert not cli._is_up_to_date(log, config)
+
+
+def test_corrupt_processed_file_is_ignored(tmp_path, config, cache_dir):
+    log = _write_log(tmp_path / "s.jsonl", [_entry("/p/alpha")])
+    _write_project_note(config)
+    cache_dir.mkdir()
+    cli.PROCESSED_FILE.write_text("{not json", encoding="utf-8")
+    assert not cli._is_up_to_date(log, config)
+    cli._mark_processed(log, cli._log_stamp(log))
+    assert cli._is_up_to_date(log, config)
+    assert sorted(p.name for p in cache_dir.iterdir()) == ["processed.json"]
+
+
+@pytest.fixture
+def stub_pipeline(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        cli,
+        "_prepare_session",
+        lambda log_path, config: (SimpleNamespace(log_path=log_path, project_name="alpha"), "text"),
+    )
+    monkeypatch.setattr(cli, "_extract", lambda conversation, config: "extract")
+    monkeypatch.setattr(
+        cli,
+        "_finish_session",
+        lambda session, extract, config, dry_run, out=None: calls.append(session.log_path),
+    )
+    return calls
+
+
+def test_process_session_skips_once_written(tmp_path, config, stub_pipeline):
+    log = _write_log(tmp_path / "s.jsonl", [_entry("/p/alpha")])
+    _write_project_note(config)
+    cli._process_session(log, config, dry_run=False, skip_existing=True)
+    cli._process_session(log, config, dry_run=False, skip_existing=True)
+    assert stub_pipeline == [log]
+
+
+def test_dry_run_does_not_mark_processed(tmp_path, config, stub_pipeline):
+    log = _write_log(tmp_path / "s.jsonl", [_entry("/p/alpha")])
+    _write_project_note(config)
+    cli._process_session(log, config, dry_run=True, skip_existing=True)
+    cli._process_session(log, config, dry_run=True, skip_existing=True)
+    assert stub_pipeline == [log, log]
+
+
+def test_process_sessions_skips_only_written_sessions(tmp_path, config, stub_pipeline):
+    done = _write_log(tmp_path / "done.jsonl", [_entry("/p/alpha", session_id="a")])
+    new = _write_log(tmp_path / "new.jsonl", [_entry("/p/alpha", session_id="b")])
+    _write_project_note(config)
+    cli._process_sessions([("alpha", done)], config, dry_run=False)
+    cli._process_sessions([("alpha", done), ("alpha", new)], config, dry_run=False, skip_existing=True)
+    assert stub_pipeline == [done, new]
+
+
+def test_record_drops_logs_that_no_longer_exist(tmp_path, config):
+    gone = _write_log(tmp_path / "gone.jsonl", [_entry("/p/alpha", session_id="a")])
+    kept = _write_log(tmp_path / "kept.jsonl", [_entry("/p/alpha", session_id="b")])
+    new = _write_log(tmp_path / "new.jsonl", [_entry("/p/alpha", session_id="c")])
+    cli._mark_processed(gone, cli._log_stamp(gone))
+    cli._mark_processed(kept, cli._log_stamp(kept))
+    gone.unlink()
+    cli._mark_processed(new, cli._log_stamp(new))
+    assert sorted(cli._read_processed()) == [str(kept), str(new)]